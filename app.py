@@ -19,6 +19,7 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from predict import PECPredictor
+from data_io import read_table, resolve_table, resolve_model
 
 # Page Configuration
 st.set_page_config(
@@ -90,9 +91,9 @@ def load_predictor(_refresh_trigger=None):
     """Load the trained model with optional refresh trigger"""
     try:
         predictor = PECPredictor(
-            model_path='models/pec_demand_model.json',
+            model_path='models/pec_demand_model.ubj',
             metadata_path='models/model_metadata.pkl',
-            data_path='data/processed/pec_features.csv'
+            data_path='data/processed/pec_features.parquet'
         )
         return predictor
     except Exception as e:
@@ -409,15 +410,18 @@ def main():
             """)
             
             uploaded_file = st.file_uploader(
-                "Upload PEC Footfall Data (CSV)",
-                type=['csv'],
+                "Upload PEC Footfall Data (CSV or Parquet)",
+                type=['csv', 'parquet'],
                 help="Upload your historical footfall data"
             )
             
             if uploaded_file is not None:
                 try:
                     # Read uploaded data
-                    raw_data = pd.read_csv(uploaded_file)
+                    if uploaded_file.name.endswith('.parquet'):
+                        raw_data = pd.read_parquet(uploaded_file)
+                    else:
+                        raw_data = pd.read_csv(uploaded_file)
                     
                     st.success(f"✅ Data loaded successfully: {len(raw_data):,} rows")
                     
@@ -464,7 +468,7 @@ def main():
                                     progress_bar.progress(60)
                                     
                                     # Load features
-                                    features_df = pd.read_csv('data/processed/pec_features.csv')
+                                    features_df = read_table('data/processed/pec_features.parquet')
                                     
                                     # Prepare data - exclude string columns (they're already encoded)
                                     exclude_cols = [
@@ -499,7 +503,7 @@ def main():
                                     mape = np.mean(np.abs((y_test - y_pred) / y_test)) * 100
                                     
                                     # Save model
-                                    model.save_model('models/pec_demand_model.json')
+                                    model.save_model('models/pec_demand_model.ubj')
                                     
                                     # Save metadata
                                     metadata = {
@@ -547,8 +551,8 @@ def main():
             st.subheader("📝 Quick Start")
             
             # Check if model already exists
-            model_exists = os.path.exists('models/pec_demand_model.json') and os.path.exists('models/model_metadata.pkl')
-            data_exists = os.path.exists('data/raw/pec_footfall_data.csv')
+            model_exists = os.path.exists(resolve_model('models/pec_demand_model.ubj')) and os.path.exists('models/model_metadata.pkl')
+            data_exists = os.path.exists(resolve_table('data/raw/pec_footfall_data.parquet'))
             
             if model_exists and data_exists:
                 st.success("""
@@ -565,7 +569,7 @@ def main():
                 """)
                 
                 if st.button("🔄 Use Existing Data", use_container_width=True):
-                    existing_data = pd.read_csv('data/raw/pec_footfall_data.csv')
+                    existing_data = read_table('data/raw/pec_footfall_data.parquet')
                     st.info(f"✅ Found {len(existing_data):,} existing records")
                     st.dataframe(existing_data.head(10), use_container_width=True)
                     
@@ -588,12 +592,12 @@ def main():
                 3. Upload generated file
                 
                 Or use existing data from:
-                `data/raw/pec_footfall_data.csv`
+                `data/raw/pec_footfall_data.parquet`
                 """)
                 
                 if st.button("🔄 Use Existing Data", use_container_width=True):
                     if data_exists:
-                        existing_data = pd.read_csv('data/raw/pec_footfall_data.csv')
+                        existing_data = read_table('data/raw/pec_footfall_data.parquet')
                         st.success(f"✅ Found {len(existing_data):,} existing records")
                         st.dataframe(existing_data.head(), use_container_width=True)
                     else:
@@ -497,7 +497,7 @@ class DataGeneratorPanel:
         print("📊 Generation Summary:")
         print(f"Date Range: {start_date} to {end_date}")
         print(f"PIN Codes: {len(self.generator.pincodes)}")
-        print(f"Output: {output_dir}/pec_footfall_data.csv")
+        print(f"Output: {output_dir}/pec_footfall_data.parquet")
         print("=" * 80)
         
         confirm = input("\n🚀 Generate data? (yes/no): ").strip().lower()
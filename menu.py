@@ -79,7 +79,7 @@ def generate_data():
         
         print()
         print("✅ Data generation completed successfully!")
-        print(f"📁 File saved: data/raw/pec_footfall_data.csv")
+        print(f"📁 File saved: data/raw/pec_footfall_data.parquet")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -100,7 +100,7 @@ def engineer_features():
         
         print()
         print("✅ Feature engineering completed successfully!")
-        print(f"📁 File saved: data/processed/pec_features.csv")
+        print(f"📁 File saved: data/processed/pec_features.parquet")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -123,7 +123,7 @@ def train_model():
         
         print()
         print("✅ Model training completed successfully!")
-        print(f"📁 Model saved: models/pec_demand_model.json")
+        print(f"📁 Model saved: models/pec_demand_model.ubj")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -480,16 +480,23 @@ def view_pincodes():
 
 def check_status():
     """Check system status and file availability"""
+    from data_io import resolve_table, resolve_model
+    
     print_header()
     print("🔍 SYSTEM STATUS CHECK")
     print("=" * 70)
     print()
     
+    base_dir = os.path.dirname(__file__)
+    raw_path = os.path.relpath(resolve_table(os.path.join(base_dir, 'data/raw/pec_footfall_data.parquet')), base_dir)
+    features_path = os.path.relpath(resolve_table(os.path.join(base_dir, 'data/processed/pec_features.parquet')), base_dir)
+    model_path = os.path.relpath(resolve_model(os.path.join(base_dir, 'models/pec_demand_model.ubj')), base_dir)
+    
     # Check files
     files_to_check = [
-        ('data/raw/pec_footfall_data.csv', 'Raw Data'),
-        ('data/processed/pec_features.csv', 'Processed Features'),
-        ('models/pec_demand_model.json', 'Trained Model'),
+        (raw_path, 'Raw Data'),
+        (features_path, 'Processed Features'),
+        (model_path, 'Trained Model'),
         ('models/model_metadata.pkl', 'Model Metadata'),
     ]
     
@@ -527,9 +534,9 @@ def check_status():
     print("💡 Recommendations:")
     print("-" * 70)
     
-    raw_exists = os.path.exists(os.path.join(os.path.dirname(__file__), 'data/raw/pec_footfall_data.csv'))
-    features_exist = os.path.exists(os.path.join(os.path.dirname(__file__), 'data/processed/pec_features.csv'))
-    model_exists = os.path.exists(os.path.join(os.path.dirname(__file__), 'models/pec_demand_model.json'))
+    raw_exists = os.path.exists(os.path.join(base_dir, raw_path))
+    features_exist = os.path.exists(os.path.join(base_dir, features_path))
+    model_exists = os.path.exists(os.path.join(base_dir, model_path))
     
     if not raw_exists:
         print("  → Run 'Generate Synthetic Data' (Option 1)")
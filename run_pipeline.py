@@ -69,10 +69,10 @@ def run_complete_pipeline():
     
     print("\n📁 Generated Files:")
     print("  Data:")
-    print("    └─ data/raw/pec_footfall_data.csv")
-    print("    └─ data/processed/pec_features.csv")
+    print("    └─ data/raw/pec_footfall_data.parquet")
+    print("    └─ data/processed/pec_features.parquet")
     print("\n  Models:")
-    print("    └─ models/pec_demand_model.json")
+    print("    └─ models/pec_demand_model.ubj")
     print("    └─ models/model_metadata.pkl")
     print("    └─ models/feature_importance.png")
     print("    └─ models/predictions_vs_actual.png")
@@ -5,16 +5,26 @@ Generates synthetic but realistic Aadhaar center footfall data for model trainin
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import os
 
-# Set random seed for reproducibility
-np.random.seed(42)
+try:
+    from data_io import write_table
+except ImportError:  # Imported as part of the src package
+    from .data_io import write_table
+
+# Seed for reproducibility
+RANDOM_SEED = 42
+
+# Day-to-day variance by center type (urban: higher, rural: more unpredictable)
+TYPE_VARIANCE_SIGMA = {'Urban': 0.15, 'Rural': 0.25, 'Semi-Urban': 0.18}
 
 class PECDataGenerator:
     """Generate synthetic PEC footfall data with realistic patterns"""
     
-    def __init__(self):
+    def __init__(self, seed=RANDOM_SEED):
+        # Random generator (all noise is drawn in bulk from this)
+        self.rng = np.random.default_rng(seed)
+        
         # Indian PIN codes (sample from different regions)
         self.pincodes = {
             '110001': {'district': 'Central Delhi', 'state': 'Delhi', 'type': 'Urban', 'base_footfall': 180},
@@ -50,7 +60,7 @@ class PECDataGenerator:
         ]
         
     def generate_footfall_data(self, start_date='2025-01-01', end_date='2026-01-31', 
-                               output_dir='data/raw'):
+                               output_dir='data/raw', output_format='parquet'):
         """
         Generate synthetic footfall data with realistic patterns
         
@@ -58,38 +68,41 @@ class PECDataGenerator:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             output_dir: Directory to save the generated data
+            output_format: 'parquet' (default) or 'csv' for a human-readable copy
         """
         # Create date range
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        # Generate data for all PEC locations
-        all_data = []
-        
-        for pincode, info in self.pincodes.items():
-            for date in dates:
-                footfall = self._calculate_footfall(date, pincode, info)
-                
-                record = {
-                    'date': date.strftime('%Y-%m-%d'),
-                    'pincode': pincode,
-                    'district': info['district'],
-                    'state': info['state'],
-                    'center_type': info['type'],
-                    'footfall': max(0, footfall)  # Ensure non-negative
-                }
-                
-                all_data.append(record)
-        
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-        
-        # Save to CSV
+        # Structure-of-arrays view of the PIN table (built here, since the
+        # panel edits self.pincodes after construction)
+        pins = self._pincode_arrays()
+        
+        # Draw all random noise up front (one bulk draw per component)
+        shape = (len(pins['pincode']), len(dates))
+        sigma = np.array([TYPE_VARIANCE_SIGMA.get(t, 0.18) for t in pins['type']])
+        variance = self.rng.normal(1.0, sigma[:, None], size=shape)
+        noise = self.rng.normal(0.0, pins['base_footfall'][:, None] * 0.08, size=shape)
+        
+        # Footfall for every (PIN, date) pair at once
+        footfall = self._calculate_footfall(dates, pins, variance, noise)
+        
+        # Create DataFrame (PIN-major order: all dates of one PIN, then the next)
+        n_dates = len(dates)
+        df = pd.DataFrame({
+            'date': np.tile(dates.values, len(pins['pincode'])),
+            'pincode': np.repeat(pins['pincode'], n_dates),
+            'district': np.repeat(pins['district'], n_dates),
+            'state': np.repeat(pins['state'], n_dates),
+            'center_type': np.repeat(pins['type'], n_dates),
+            'footfall': np.maximum(footfall, 0).ravel()  # Ensure non-negative
+        })
+        
+        # Save (Parquet keeps the date column typed for feature engineering)
         os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, 'pec_footfall_data.csv')
-        df.to_csv(output_path, index=False)
+        output_path = write_table(df, os.path.join(output_dir, 'pec_footfall_data'), output_format)
         
         print(f"✅ Generated {len(df):,} records")
-        print(f"📅 Date range: {df['date'].min()} to {df['date'].max()}")
+        print(f"📅 Date range: {df['date'].min().date()} to {df['date'].max().date()}")
         print(f"📍 PIN codes: {len(df['pincode'].unique())}")
         print(f"💾 Saved to: {output_path}")
         
@@ -99,82 +112,105 @@ class PECDataGenerator:
         
         return df
     
-    def _calculate_footfall(self, date, pincode, info):
-        """Calculate footfall for a specific date and location"""
-        base = info['base_footfall']
+    def _pincode_arrays(self):
+        """
+        Convert the PIN code table into aligned NumPy arrays
         
-        # 1. Day of week pattern (Monday peak, weekend low)
-        day_multipliers = {
-            0: 1.25,  # Monday (highest)
-            1: 1.15,  # Tuesday
-            2: 1.10,  # Wednesday
-            3: 1.05,  # Thursday
-            4: 1.00,  # Friday
-            5: 0.70,  # Saturday (lower)
-            6: 0.50   # Sunday (lowest)
+        Returns:
+            Dict of column name -> array (one entry per PIN code)
+        """
+        infos = list(self.pincodes.values())
+        return {
+            'pincode': np.array(list(self.pincodes.keys()), dtype=object),
+            'district': np.array([info['district'] for info in infos], dtype=object),
+            'state': np.array([info['state'] for info in infos], dtype=object),
+            'type': np.array([info['type'] for info in infos], dtype=object),
+            'base_footfall': np.array([info['base_footfall'] for info in infos], dtype=float),
         }
-        day_mult = day_multipliers.get(date.weekday(), 1.0)
+    
+    def _holiday_day_codes(self):
+        """Holidays as integer day numbers (days since 1970-01-01)"""
+        return pd.to_datetime(self.holidays).values.astype('datetime64[D]').view('int64')
+    
+    def _calculate_footfall(self, dates, pins, type_variance, noise):
+        """
+        Calculate footfall for every location and date
+        
+        Date effects are computed once per date and PIN effects once per PIN,
+        then broadcast into a (n_pincodes, n_dates) grid.
+        
+        Args:
+            dates: DatetimeIndex of dates to generate
+            pins: PIN code arrays from _pincode_arrays()
+            type_variance: Pre-drawn multiplicative variance, shape (n_pincodes, n_dates)
+            noise: Pre-drawn additive noise, shape (n_pincodes, n_dates)
+            
+        Returns:
+            Integer footfall array of shape (n_pincodes, n_dates)
+        """
+        base = pins['base_footfall'][:, None]
+        
+        # 1. Day of week pattern (Monday peak, weekend low)
+        day_multipliers = np.array([
+            1.25,  # Monday (highest)
+            1.15,  # Tuesday
+            1.10,  # Wednesday
+            1.05,  # Thursday
+            1.00,  # Friday
+            0.70,  # Saturday (lower)
+            0.50   # Sunday (lowest)
+        ])
+        day_mult = day_multipliers[dates.dayofweek]
         
         # 2. Holiday effect (sharp drop on holiday, spike next day)
-        is_holiday = date.strftime('%Y-%m-%d') in self.holidays
-        if is_holiday:
-            day_mult *= 0.20  # 80% drop on holidays
-        else:
-            # Check if yesterday was a holiday (spike effect)
-            yesterday = (date - timedelta(days=1)).strftime('%Y-%m-%d')
-            if yesterday in self.holidays:
-                day_mult *= 1.40  # 40% spike after holiday
+        day_codes = dates.values.astype('datetime64[D]').view('int64')
+        holiday_days = self._holiday_day_codes()
+        is_holiday = np.isin(day_codes, holiday_days)
+        after_holiday = np.isin(day_codes - 1, holiday_days)
+        day_mult = np.where(is_holiday, day_mult * 0.20,  # 80% drop on holidays
+                            np.where(after_holiday, day_mult * 1.40, day_mult))  # 40% spike after holiday
         
         # 3. Monthly patterns (seasonal effects)
-        month_multipliers = {
-            1: 0.95,   # January
-            2: 0.90,   # February
-            3: 1.00,   # March
-            4: 1.15,   # April (new financial year, updates)
-            5: 1.10,   # May
-            6: 1.35,   # June (SCHOOL ENROLLMENT PEAK)
-            7: 1.40,   # July (SCHOOL ENROLLMENT PEAK)
-            8: 1.05,   # August
-            9: 1.00,   # September
-            10: 1.20,  # October (festival season, scheme registrations)
-            11: 1.45,  # November (PENSION LIFE CERTIFICATE PEAK)
-            12: 1.10   # December
-        }
-        month_mult = month_multipliers.get(date.month, 1.0)
+        month_multipliers = np.array([
+            0.0,   # (unused, months are 1-based)
+            0.95,  # January
+            0.90,  # February
+            1.00,  # March
+            1.15,  # April (new financial year, updates)
+            1.10,  # May
+            1.35,  # June (SCHOOL ENROLLMENT PEAK)
+            1.40,  # July (SCHOOL ENROLLMENT PEAK)
+            1.05,  # August
+            1.00,  # September
+            1.20,  # October (festival season, scheme registrations)
+            1.45,  # November (PENSION LIFE CERTIFICATE PEAK)
+            1.10   # December
+        ])
+        month_mult = month_multipliers[dates.month]
         
         # 4. Special rural pattern for pension updates
-        if info['type'] == 'Rural' and date.month == 11:
-            month_mult *= 1.60  # Extra spike for rural pension updates
+        is_rural = (pins['type'] == 'Rural')[:, None]
+        month_mult = np.where(is_rural & (dates.month == 11), month_mult * 1.60, month_mult)
         
         # 5. Week of month pattern (first week often busy for monthly updates)
-        week_of_month = (date.day - 1) // 7 + 1
-        if week_of_month == 1:
-            week_mult = 1.10
-        elif week_of_month == 4:
-            week_mult = 0.95  # Slight drop in last week
-        else:
-            week_mult = 1.00
-        
-        # 6. Urban vs Rural patterns
-        if info['type'] == 'Urban':
-            type_variance = np.random.normal(1.0, 0.15)  # Higher variance
-        elif info['type'] == 'Rural':
-            type_variance = np.random.normal(1.0, 0.25)  # More unpredictable
-        else:  # Semi-Urban
-            type_variance = np.random.normal(1.0, 0.18)
+        week_of_month = (dates.day - 1) // 7 + 1
+        week_mult = np.select([week_of_month == 1, week_of_month == 4],
+                              [1.10, 0.95],  # Slight drop in last week
+                              default=1.00)
+        
+        # 6. Urban vs Rural patterns: type_variance is pre-drawn per center type
         
         # 7. Long-term trend (slight increase over time for Aadhaar updates)
-        days_from_start = (date - pd.to_datetime('2025-01-01')).days
+        days_from_start = (dates - pd.Timestamp('2025-01-01')).days.values
         trend = 1.0 + (days_from_start / 365) * 0.05  # 5% annual growth
         
         # Calculate final footfall
         footfall = base * day_mult * month_mult * week_mult * type_variance * trend
         
         # Add some noise
-        noise = np.random.normal(0, base * 0.08)
         footfall += noise
         
-        return int(round(footfall))
+        return np.round(footfall).astype(int)
 
 def main():
     """Main execution function"""
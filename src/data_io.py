@@ -0,0 +1,212 @@
+"""
+Dataset I/O Helpers
+Shared readers/writers for the raw and processed PEC datasets
+"""
+
+import pandas as pd
+import pyarrow.parquet as pq
+import hashlib
+import json
+import os
+
+# Formats the pipeline can persist tables in (preferred first)
+TABLE_FORMATS = ('parquet', 'csv')
+
+# Formats the trained XGBoost model can be saved in (preferred first)
+MODEL_FORMATS = ('ubj', 'json')
+
+# Known column types for CSV input (skips inference; PIN codes stay strings)
+CSV_DTYPES = {
+    'pincode': str,
+    'district': str,
+    'state': str,
+    'center_type': str,
+}
+
+def table_path(path, output_format):
+    """Return `path` with its extension swapped for `output_format`"""
+    return f"{os.path.splitext(path)[0]}.{output_format}"
+
+def resolve_table(path):
+    """
+    Find the on-disk copy of a dataset
+
+    `pec_features.parquet` and `pec_features.csv` are treated as the same
+    dataset, so callers can pass either name. When both exist the most
+    recently written one wins (e.g. a freshly uploaded CSV beats an older
+    generated Parquet file).
+
+    Args:
+        path: Path to the dataset (.parquet or .csv)
+
+    Returns:
+        Path of the file to read (the original path if nothing exists)
+    """
+    return _newest_copy(path, TABLE_FORMATS)
+
+def resolve_model(path):
+    """
+    Find the on-disk copy of a saved XGBoost model
+
+    Models are saved as binary UBJSON (`.ubj`, faster to load); older runs
+    left text `.json` files. Either name can be passed and the most recently
+    saved copy wins.
+
+    Args:
+        path: Path to the model (.ubj or .json)
+
+    Returns:
+        Path of the file to load (the original path if nothing exists)
+    """
+    return _newest_copy(path, MODEL_FORMATS)
+
+def _newest_copy(path, formats):
+    """Most recently written copy of `path` in any of `formats` (or `path` itself)"""
+    candidates = [table_path(path, fmt) for fmt in formats]
+    candidates = [p for p in candidates if os.path.exists(p)]
+
+    if not candidates:
+        return path
+
+    return max(candidates, key=os.path.getmtime)
+
+def read_table(path, columns=None, **csv_kwargs):
+    """
+    Load a dataset written by the pipeline (Parquet or CSV)
+
+    Parquet keeps column types, so `date` comes back as datetime64 without
+    re-parsing. CSV is still accepted for hand-made / uploaded data.
+
+    Args:
+        path: Path to the dataset (.parquet or .csv)
+        columns: Only load these columns (ones missing from the file are
+                 skipped); None loads everything
+        **csv_kwargs: Extra arguments for `pd.read_csv` (CSV input only;
+                      pass engine='c' for options the pyarrow engine lacks)
+
+    Returns:
+        DataFrame with `date` parsed as datetime64
+    """
+    path = resolve_table(path)
+
+    if path.endswith('.parquet'):
+        if columns is not None:
+            available = set(pq.read_schema(path).names)
+            columns = [col for col in columns if col in available]
+        df = pd.read_parquet(path, engine='pyarrow', columns=columns)
+    else:
+        # Multithreaded Arrow tokenizer (converted to regular NumPy dtypes)
+        csv_kwargs.setdefault('engine', 'pyarrow')
+        
+        # Parse dates while reading; every PIN repeats the same dates, so the
+        # cache turns this into one parse per unique date string
+        header = pd.read_csv(path, nrows=0).columns
+        if columns is not None:
+            header = header[header.isin(columns)]
+            csv_kwargs.setdefault('usecols', list(header))
+        if 'date' in header:
+            csv_kwargs.setdefault('parse_dates', ['date'])
+            csv_kwargs.setdefault('cache_dates', True)
+        csv_kwargs.setdefault('dtype', {col: dtype for col, dtype in CSV_DTYPES.items() if col in header})
+        df = pd.read_csv(path, **csv_kwargs)
+
+    if 'date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['date']):
+        df['date'] = pd.to_datetime(df['date'])
+
+    return df
+
+def load_features(path='data/processed/pec_features.parquet', columns=None):
+    """
+    Load the engineered feature table for analysis/validation
+
+    If the newest copy is a CSV (e.g. the checked-in sample or a hand-edited
+    file) it is parsed once and saved as Parquet next to it, so later runs
+    read the typed columnar copy instead of re-parsing text.
+
+    Args:
+        path: Path to the features (.parquet or .csv)
+        columns: Only return these columns (see `read_table`)
+
+    Returns:
+        DataFrame with `date` parsed as datetime64
+    """
+    source = resolve_table(path)
+
+    if not source.endswith('.csv'):
+        return read_table(source, columns=columns)
+
+    df = read_table(source)
+    try:
+        write_table(df, source, 'parquet')
+    except OSError:
+        pass  # Read-only location - just use the CSV
+
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    return df
+
+def write_table(df, path, output_format='parquet'):
+    """
+    Save a dataset in the requested format
+
+    Args:
+        df: DataFrame to save
+        path: Destination path (extension is replaced to match the format)
+        output_format: 'parquet' (default, fast typed I/O) or 'csv' (human readable)
+
+    Returns:
+        Path the file was written to
+    """
+    if output_format not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported output format '{output_format}'. Use one of {TABLE_FORMATS}")
+
+    path = table_path(path, output_format)
+
+    if output_format == 'parquet':
+        df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        # Short float repr (float32 features carry ~7 significant digits) and
+        # chunked encoding keep the text copy small and the write buffers bounded
+        df.to_csv(path, index=False, float_format='%.7g', chunksize=100_000, lineterminator='\n')
+
+    return path
+
+def file_signature(path):
+    """Size and modification time of a file (changes whenever it is rewritten)"""
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def source_hash(*paths):
+    """Hash of source files, so cached outputs expire when the code changes"""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def read_cache_manifest(manifest_path, key):
+    """
+    Look up a cached output recorded by `write_cache_manifest`
+    
+    Args:
+        manifest_path: Path to the JSON manifest next to the cached output
+        key: Dict describing the inputs (must match the recorded key exactly)
+        
+    Returns:
+        Path of the cached output, or None if missing/stale
+    """
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest['key'] != key:
+            return None
+        if file_signature(manifest['output']['path']) != manifest['output']:
+            return None  # Output was rewritten by something else since
+        return manifest['output']['path']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_cache_manifest(manifest_path, key, output_path):
+    """Record that `output_path` was produced from inputs described by `key`"""
+    with open(manifest_path, 'w') as f:
+        json.dump({'key': key, 'output': file_signature(output_path)}, f, indent=2)
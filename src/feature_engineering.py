@@ -8,6 +8,91 @@ import numpy as np
 from datetime import datetime, timedelta
 import os
 
+try:
+    from data_io import (read_table, write_table, resolve_table, file_signature,
+                         source_hash, read_cache_manifest, write_cache_manifest)
+except ImportError:  # Imported as part of the src package
+    from .data_io import (read_table, write_table, resolve_table, file_signature,
+                          source_hash, read_cache_manifest, write_cache_manifest)
+
+# Common naming variations of the required columns (alias -> standard name)
+COLUMN_ALIASES = {
+    # Date variations
+    'Date': 'date',
+    'DATE': 'date',
+    'transaction_date': 'date',
+    'visit_date': 'date',
+    
+    # PIN code variations
+    'PIN': 'pincode',
+    'pin': 'pincode',
+    'PIN_code': 'pincode',
+    'pin_code': 'pincode',
+    'PINCODE': 'pincode',
+    'pec_id': 'pincode',
+    'center_id': 'pincode',
+    
+    # Footfall variations
+    'Footfall': 'footfall',
+    'FOOTFALL': 'footfall',
+    'count': 'footfall',
+    'visitors': 'footfall',
+    'footfall_count': 'footfall',
+    'daily_count': 'footfall',
+    'transactions': 'footfall',
+    'enrollments': 'footfall',
+    
+    # District variations
+    'District': 'district',
+    'DISTRICT': 'district',
+    'dist': 'district',
+    
+    # State variations
+    'State': 'state',
+    'STATE': 'state',
+    
+    # Center type variations
+    'center_type': 'center_type',
+    'Center_Type': 'center_type',
+    'CENTER_TYPE': 'center_type',
+    'type': 'center_type',
+    'location_type': 'center_type',
+    'pec_type': 'center_type',
+}
+
+# Columns every raw dataset must provide
+REQUIRED_COLUMNS = ['date', 'pincode', 'footfall', 'district', 'state', 'center_type']
+
+# Longest lookback of the lag features (first rows of each PIN lack full history)
+LAG_WARMUP_DAYS = 30
+
+# Standard center type labels
+VALID_CENTER_TYPES = ['Urban', 'Rural', 'Semi-Urban']
+
+# Storage dtypes of the engineered features. Flags and calendar parts fit in
+# small ints; footfall-derived statistics are kept as float32 (XGBoost trains
+# on float32 anyway, so nothing is lost).
+FEATURE_DTYPES = {
+    # Temporal
+    'day_of_week': 'int8', 'is_weekend': 'int8', 'is_monday': 'int8',
+    'month': 'int8', 'quarter': 'int8', 'week_of_month': 'int8',
+    'day_of_month': 'int8', 'is_first_week': 'int8', 'is_holiday': 'int8',
+    'is_day_after_holiday': 'int8', 'is_enrollment_season': 'int8',
+    'is_pension_month': 'int8', 'is_festival_season': 'int8', 'day_of_year': 'int16',
+    # Geographic
+    'center_type_encoded': 'int8', 'is_urban': 'int8', 'is_rural': 'int8',
+    'state_encoded': 'int16', 'district_encoded': 'int16', 'pincode_category': 'int16',
+    # Lag
+    'footfall_lag_7': 'float32', 'footfall_lag_14': 'float32', 'footfall_lag_30': 'float32',
+    'footfall_rolling_mean_7': 'float32', 'footfall_rolling_mean_14': 'float32',
+    'footfall_rolling_mean_30': 'float32', 'footfall_rolling_std_7': 'float32',
+    'footfall_change_7d': 'float32', 'footfall_change_30d': 'float32',
+    'footfall_rolling_max_30': 'float32', 'footfall_rolling_min_30': 'float32',
+    # Interaction
+    'rural_pension_interaction': 'int8', 'urban_enrollment_interaction': 'int8',
+    'monday_first_week': 'int8', 'weekend_holiday': 'int8', 'lag_ratio_7_to_30': 'float32',
+}
+
 class FeatureEngineer:
     """Extract and transform features for ML model"""
     
@@ -22,6 +107,17 @@ class FeatureEngineer:
             '2026-11-01', '2026-11-14', '2026-12-25'
         ]
     
+    def _cache_key(self, input_path, output_format):
+        """Everything the processed features depend on (raw file, holidays, code)"""
+        src_dir = os.path.dirname(os.path.abspath(__file__))
+        return {
+            'input': file_signature(resolve_table(input_path)),
+            'holidays': sorted(self.holidays),
+            'code': source_hash(os.path.join(src_dir, 'feature_engineering.py'),
+                                os.path.join(src_dir, 'data_io.py')),
+            'output_format': output_format,
+        }
+    
     def _validate_and_fix_columns(self, df):
         """
         Auto-detect and fix missing or incorrectly named columns
@@ -40,63 +136,25 @@ class FeatureEngineer:
         issues_fixed = 0
         
         # 1. Check required columns
-        required_cols = ['date', 'pincode', 'footfall', 'district', 'state', 'center_type']
+        required_cols = REQUIRED_COLUMNS
         missing_cols = [col for col in required_cols if col not in df.columns]
         
         if missing_cols:
             print(f"⚠️  Missing columns detected: {missing_cols}")
             
-            # Try to auto-fix common naming variations
-            column_mapping = {
-                # Date variations
-                'Date': 'date',
-                'DATE': 'date',
-                'transaction_date': 'date',
-                'visit_date': 'date',
-                
-                # PIN code variations
-                'PIN': 'pincode',
-                'pin': 'pincode',
-                'PIN_code': 'pincode',
-                'pin_code': 'pincode',
-                'PINCODE': 'pincode',
-                'pec_id': 'pincode',
-                'center_id': 'pincode',
-                
-                # Footfall variations
-                'Footfall': 'footfall',
-                'FOOTFALL': 'footfall',
-                'count': 'footfall',
-                'visitors': 'footfall',
-                'footfall_count': 'footfall',
-                'daily_count': 'footfall',
-                'transactions': 'footfall',
-                'enrollments': 'footfall',
-                
-                # District variations
-                'District': 'district',
-                'DISTRICT': 'district',
-                'dist': 'district',
-                
-                # State variations
-                'State': 'state',
-                'STATE': 'state',
-                
-                # Center type variations
-                'center_type': 'center_type',
-                'Center_Type': 'center_type',
-                'CENTER_TYPE': 'center_type',
-                'type': 'center_type',
-                'location_type': 'center_type',
-                'pec_type': 'center_type',
-            }
+            # Try to auto-fix common naming variations (one rename call;
+            # only the first alias found for each target is used)
+            have = set(df.columns)
+            renames = {}
+            for old_col, new_col in COLUMN_ALIASES.items():
+                if old_col in have and new_col not in have and new_col not in renames.values():
+                    renames[old_col] = new_col
             
-            # Apply mappings
-            for old_col, new_col in column_mapping.items():
-                if old_col in df.columns and new_col not in df.columns:
-                    df.rename(columns={old_col: new_col}, inplace=True)
+            if renames:
+                df.rename(columns=renames, inplace=True)
+                for old_col, new_col in renames.items():
                     print(f"  ✅ Renamed '{old_col}' → '{new_col}'")
-                    issues_fixed += 1
+                issues_fixed += len(renames)
         
         # 2. Check again for missing columns and infer them
         missing_cols = [col for col in required_cols if col not in df.columns]
@@ -105,9 +163,9 @@ class FeatureEngineer:
             print("  ⚠️  'center_type' missing - inferring from PIN code patterns...")
             # Infer center type based on footfall patterns
             if 'footfall' in df.columns:
-                df['center_type'] = df['footfall'].apply(lambda x: 
-                    'Urban' if x > 150 else ('Rural' if x < 100 else 'Semi-Urban')
-                )
+                footfall = df['footfall'].values
+                df['center_type'] = np.select([footfall > 150, footfall < 100],
+                                              ['Urban', 'Rural'], default='Semi-Urban')
                 print(f"  ✅ Inferred center_type from footfall patterns")
                 issues_fixed += 1
             else:
@@ -126,38 +184,33 @@ class FeatureEngineer:
             df['state'] = 'Unknown State'
             issues_fixed += 1
         
-        # 3. Ensure pincode is string type
-        if 'pincode' in df.columns:
+        # 3. Ensure pincode is string type (already true for generated data)
+        if 'pincode' in df.columns and not pd.api.types.is_object_dtype(df['pincode']):
             df['pincode'] = df['pincode'].astype(str)
         
-        # 4. Standardize center_type values
-        if 'center_type' in df.columns:
-            # Map variations to standard values
+        # 4. Standardize center_type values (skipped when all values are already valid)
+        if 'center_type' in df.columns and not df['center_type'].isin(VALID_CENTER_TYPES).all():
+            # Map variations to standard values (matched case-insensitively)
             center_type_mapping = {
                 'urban': 'Urban',
-                'URBAN': 'Urban',
-                'U': 'Urban',
+                'u': 'Urban',
                 'rural': 'Rural',
-                'RURAL': 'Rural',
-                'R': 'Rural',
+                'r': 'Rural',
                 'semi-urban': 'Semi-Urban',
                 'semi urban': 'Semi-Urban',
-                'SEMI-URBAN': 'Semi-Urban',
-                'SEMI URBAN': 'Semi-Urban',
-                'S': 'Semi-Urban',
+                's': 'Semi-Urban',
                 'semiurban': 'Semi-Urban',
             }
             
-            df['center_type'] = df['center_type'].replace(center_type_mapping)
+            standardized = df['center_type'].astype(str).str.strip().str.lower().map(center_type_mapping)
             
             # Set any unrecognized values to Urban
-            valid_types = ['Urban', 'Rural', 'Semi-Urban']
-            invalid_mask = ~df['center_type'].isin(valid_types)
+            invalid_mask = standardized.isna()
             if invalid_mask.any():
                 invalid_count = invalid_mask.sum()
                 print(f"  ⚠️  Found {invalid_count} invalid center_type values - defaulting to 'Urban'")
-                df.loc[invalid_mask, 'center_type'] = 'Urban'
                 issues_fixed += 1
+            df['center_type'] = standardized.fillna('Urban')
         
         # 5. Final validation
         final_missing = [col for col in required_cols if col not in df.columns]
@@ -175,29 +228,45 @@ class FeatureEngineer:
         
         return df
     
-    def engineer_features(self, input_path='data/raw/pec_footfall_data.csv', 
-                         output_dir='data/processed'):
+    def engineer_features(self, input_path='data/raw/pec_footfall_data.parquet', 
+                         output_dir='data/processed', output_format='parquet', use_cache=True):
         """
         Create all features from raw data
         
         Args:
-            input_path: Path to raw CSV file
+            input_path: Path to raw data file (Parquet or CSV)
             output_dir: Directory to save processed data
+            output_format: 'parquet' (default) or 'csv' for a human-readable copy
+            use_cache: Reuse the saved features if the raw file, holidays and
+                       feature code are unchanged since they were written
         """
         print("🔧 Starting Feature Engineering...")
         print("=" * 60)
         
-        # Load data
-        df = pd.read_csv(input_path)
-        df['date'] = pd.to_datetime(df['date'])
+        # Skip the whole pipeline when nothing it depends on has changed
+        manifest_path = os.path.join(output_dir, 'pec_features.cache.json')
+        cache_key = self._cache_key(input_path, output_format)
+        cached_path = read_cache_manifest(manifest_path, cache_key) if use_cache else None
+        if cached_path:
+            df = read_table(cached_path)
+            df = df.astype({col: dtype for col, dtype in FEATURE_DTYPES.items() if col in df.columns})
+            print(f"♻️  Raw data unchanged - reusing features from {cached_path}")
+            print(f"📊 Final dataset: {len(df):,} records with {len(df.columns)} features")
+            return df
+        
+        # Load data (Parquet input arrives with `date` already typed)
+        df = read_table(input_path)
         
         print(f"📊 Loaded {len(df):,} records")
         
         # AUTO-FIX: Validate and correct column names
         df = self._validate_and_fix_columns(df)
         
+        # An aliased date column (e.g. `Date`) is read as text; type it like the cache does
+        df['date'] = pd.to_datetime(df['date'])
+        
         # Sort by pincode and date (essential for lag features)
-        df = df.sort_values(['pincode', 'date']).reset_index(drop=True)
+        df = df.sort_values(['pincode', 'date'], ignore_index=True)
         
         # 1. TEMPORAL FEATURES
         print("\n⏰ Creating temporal features...")
@@ -209,21 +278,29 @@ class FeatureEngineer:
         
         # 3. LAG FEATURES (Time-Series)
         print("📈 Creating lag features...")
-        df = self._add_lag_features(df)
+        position = self._run_positions(df['pincode'].to_numpy())
+        df = self._add_lag_features(df, position)
         
         # 4. INTERACTION FEATURES
         print("🔗 Creating interaction features...")
         df = self._add_interaction_features(df)
         
-        # Remove rows with NaN (due to lag feature calculation)
+        # Remove rows with NaN (due to lag feature calculation). The warm-up rows of
+        # each PIN always lack lag values, so drop them by position; any row still
+        # holding a NaN (missing footfall, gaps in extra columns) is dropped as before
         initial_count = len(df)
-        df = df.dropna()
+        df = df[position >= LAG_WARMUP_DAYS]
+        if df.isna().to_numpy().any():
+            df = df.dropna()
         print(f"\n🧹 Removed {initial_count - len(df):,} rows with missing lag values")
         
+        # Apply the fixed storage schema
+        df = df.astype({col: dtype for col, dtype in FEATURE_DTYPES.items() if col in df.columns})
+        
         # Save processed data
         os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, 'pec_features.csv')
-        df.to_csv(output_path, index=False)
+        output_path = write_table(df, os.path.join(output_dir, 'pec_features'), output_format)
+        write_cache_manifest(manifest_path, cache_key, output_path)
         
         print(f"\n✅ Feature engineering complete!")
         print(f"📁 Saved to: {output_path}")
@@ -237,121 +314,166 @@ class FeatureEngineer:
         
         return df
     
+    def _holiday_day_codes(self):
+        """Holidays as integer day numbers (days since 1970-01-01)"""
+        return pd.to_datetime(self.holidays).values.astype('datetime64[D]').view('int64')
+    
     def _add_temporal_features(self, df):
         """Add date-based temporal features"""
         
-        # Day of week (0=Monday, 6=Sunday)
-        df['day_of_week'] = df['date'].dt.dayofweek
+        # Split the date column into calendar parts once (plain NumPy arithmetic
+        # on day numbers instead of one .dt accessor pass per feature)
+        dates = df['date'].values.astype('datetime64[D]')
+        month_start = dates.astype('datetime64[M]')
+        day_codes = dates.view('int64')                               # days since 1970-01-01 (a Thursday)
+        day_of_week = ((day_codes + 3) % 7).astype('int8')
+        month = (month_start.astype('int64') % 12 + 1).astype('int8')
+        day_of_month = ((dates - month_start).astype('int64') + 1).astype('int8')
+        day_of_year = ((dates - dates.astype('datetime64[Y]')).astype('int64') + 1).astype('int16')
         
-        # Day name (for readability)
-        df['day_name'] = df['date'].dt.day_name()
+        # Day of week (0=Monday, 6=Sunday)
+        df['day_of_week'] = day_of_week
         
         # Is weekend
-        df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
+        df['is_weekend'] = (day_of_week >= 5).astype('int8')
         
         # Is Monday (typically highest footfall)
-        df['is_monday'] = (df['day_of_week'] == 0).astype(int)
+        df['is_monday'] = (day_of_week == 0).astype('int8')
         
         # Month (1-12)
-        df['month'] = df['date'].dt.month
+        df['month'] = month
         
         # Quarter
-        df['quarter'] = df['date'].dt.quarter
+        df['quarter'] = (month - 1) // 3 + 1
         
         # Week of month (1-5)
-        df['week_of_month'] = ((df['date'].dt.day - 1) // 7 + 1)
+        week_of_month = (day_of_month - 1) // 7 + 1
+        df['week_of_month'] = week_of_month
         
         # Day of month
-        df['day_of_month'] = df['date'].dt.day
+        df['day_of_month'] = day_of_month
         
         # Is first week of month (bill payments, updates)
-        df['is_first_week'] = (df['week_of_month'] == 1).astype(int)
+        df['is_first_week'] = (week_of_month == 1).astype('int8')
         
-        # Is holiday
-        df['is_holiday'] = df['date'].dt.strftime('%Y-%m-%d').isin(self.holidays).astype(int)
+        # Is holiday (compared as integer day numbers, no per-row string formatting)
+        holiday_days = self._holiday_day_codes()
+        df['is_holiday'] = np.isin(day_codes, holiday_days).astype('int8')
         
-        # Is day after holiday (spike effect)
-        df['is_day_after_holiday'] = df.groupby('pincode')['is_holiday'].shift(1).fillna(0).astype(int)
+        # Is day after holiday (spike effect) - depends only on the date
+        df['is_day_after_holiday'] = np.isin(day_codes - 1, holiday_days).astype('int8')
         
         # Peak enrollment months (June-July for schools)
-        df['is_enrollment_season'] = df['month'].isin([6, 7]).astype(int)
+        df['is_enrollment_season'] = ((month == 6) | (month == 7)).astype('int8')
         
         # Pension update month (November)
-        df['is_pension_month'] = (df['month'] == 11).astype(int)
+        df['is_pension_month'] = (month == 11).astype('int8')
         
         # Festival season (October)
-        df['is_festival_season'] = (df['month'] == 10).astype(int)
+        df['is_festival_season'] = (month == 10).astype('int8')
         
         # Days since year start (trend feature)
-        df['day_of_year'] = df['date'].dt.dayofyear
+        df['day_of_year'] = day_of_year
         
         return df
     
     def _add_geographic_features(self, df):
         """Add location-based features"""
         
+        # Label encodings, one hash pass per column. Center type uses a fixed order
+        # (Rural=0, Semi-Urban=1, Urban=2), PIN codes sort like a category dtype,
+        # and state/district are numbered by first appearance
+        codes = self._encode_categories(
+            df, ['center_type', 'state', 'district', 'pincode'],
+            categories={'center_type': ['Rural', 'Semi-Urban', 'Urban']},
+            sorted_columns=['pincode']
+        )
+        
         # Encode center type as numeric
-        type_mapping = {'Rural': 0, 'Semi-Urban': 1, 'Urban': 2}
-        df['center_type_encoded'] = df['center_type'].map(type_mapping)
+        df['center_type_encoded'] = codes['center_type'].astype('int8')
         
         # Is urban center
-        df['is_urban'] = (df['center_type'] == 'Urban').astype(int)
+        df['is_urban'] = (codes['center_type'] == 2).astype('int8')
         
         # Is rural center
-        df['is_rural'] = (df['center_type'] == 'Rural').astype(int)
-        
-        # State-level encoding (using label encoding for simplicity)
-        df['state_encoded'] = pd.factorize(df['state'])[0]
+        df['is_rural'] = (codes['center_type'] == 0).astype('int8')
         
-        # District-level encoding
-        df['district_encoded'] = pd.factorize(df['district'])[0]
+        # State-level and district-level encoding
+        df['state_encoded'] = codes['state']
+        df['district_encoded'] = codes['district']
         
-        # PIN code as category (XGBoost can handle this with enable_categorical)
-        df['pincode_category'] = df['pincode'].astype('category')
+        # PIN code as category code (plain ints survive the Parquet round-trip,
+        # so the model sees the same numeric feature whichever format is loaded)
+        df['pincode_category'] = codes['pincode']
         
         return df
     
-    def _add_lag_features(self, df):
-        """Add time-series lag features (CRITICAL for forecasting)"""
+    def _encode_categories(self, df, columns, categories=None, sorted_columns=()):
+        """
+        Label-encode string columns with a single hash pass each
+        
+        Args:
+            df: DataFrame holding the columns
+            columns: Column names to encode
+            categories: Optional dict of column name -> fixed category order
+                        (skips the unique-value discovery for that column)
+            sorted_columns: Columns whose codes follow sorted order; the rest
+                            are numbered by first appearance
+            
+        Returns:
+            Dict of column name -> int16 codes
+        """
+        categories = categories or {}
+        codes = {}
+        for col in columns:
+            if col in categories:
+                col_codes = pd.Categorical(df[col], categories=categories[col]).codes
+            else:
+                col_codes = pd.factorize(df[col], sort=col in sorted_columns)[0]
+            codes[col] = col_codes.astype('int16')
+        return codes
+    
+    def _add_lag_features(self, df, position):
+        """
+        Add time-series lag features (CRITICAL for forecasting)
         
-        # For each PIN code, calculate lags
+        Rows are sorted by (pincode, date), so every PIN code is one contiguous
+        run. All features are computed directly on the footfall array: lags by
+        offset indexing, rolling means/std from cumulative sums and rolling
+        max/min from a strided window view, each masked at run boundaries.
+        
+        Args:
+            df: Feature DataFrame sorted by (pincode, date)
+            position: Index of each row within its PIN code's run
+        """
+        footfall = df['footfall'].to_numpy(dtype=np.float64)
         
         # 1. Lag 7 days (same day last week)
-        df['footfall_lag_7'] = df.groupby('pincode')['footfall'].shift(7)
+        df['footfall_lag_7'] = self._lag(footfall, position, 7)
         
         # 2. Lag 14 days (two weeks ago)
-        df['footfall_lag_14'] = df.groupby('pincode')['footfall'].shift(14)
+        df['footfall_lag_14'] = self._lag(footfall, position, 14)
         
         # 3. Lag 30 days (approximately a month ago)
-        df['footfall_lag_30'] = df.groupby('pincode')['footfall'].shift(30)
+        df['footfall_lag_30'] = self._lag(footfall, position, LAG_WARMUP_DAYS)
+        
+        # Rolling statistics only look at the days *before* each row (no data leakage)
+        mean_7, std_7 = self._trailing_mean_std(footfall, position, 7)
+        mean_14, _ = self._trailing_mean_std(footfall, position, 14)
+        mean_30, _ = self._trailing_mean_std(footfall, position, 30)
+        max_30, min_30 = self._trailing_max_min(footfall, position, 30)
         
         # 4. Rolling mean - last 7 days
-        df['footfall_rolling_mean_7'] = (
-            df.groupby('pincode')['footfall']
-            .transform(lambda x: x.rolling(window=7, min_periods=1).mean())
-            .shift(1)  # Shift to avoid data leakage
-        )
+        df['footfall_rolling_mean_7'] = mean_7
         
         # 5. Rolling mean - last 14 days
-        df['footfall_rolling_mean_14'] = (
-            df.groupby('pincode')['footfall']
-            .transform(lambda x: x.rolling(window=14, min_periods=1).mean())
-            .shift(1)
-        )
+        df['footfall_rolling_mean_14'] = mean_14
         
         # 6. Rolling mean - last 30 days
-        df['footfall_rolling_mean_30'] = (
-            df.groupby('pincode')['footfall']
-            .transform(lambda x: x.rolling(window=30, min_periods=1).mean())
-            .shift(1)
-        )
+        df['footfall_rolling_mean_30'] = mean_30
         
         # 7. Rolling standard deviation (volatility measure)
-        df['footfall_rolling_std_7'] = (
-            df.groupby('pincode')['footfall']
-            .transform(lambda x: x.rolling(window=7, min_periods=1).std())
-            .shift(1)
-        )
+        df['footfall_rolling_std_7'] = std_7
         
         # 8. Week-over-week change
         df['footfall_change_7d'] = df['footfall'] - df['footfall_lag_7']
@@ -360,40 +482,98 @@ class FeatureEngineer:
         df['footfall_change_30d'] = df['footfall'] - df['footfall_lag_30']
         
         # 10. Rolling max (peak demand indicator)
-        df['footfall_rolling_max_30'] = (
-            df.groupby('pincode')['footfall']
-            .transform(lambda x: x.rolling(window=30, min_periods=1).max())
-            .shift(1)
-        )
+        df['footfall_rolling_max_30'] = max_30
         
         # 11. Rolling min (low demand indicator)
-        df['footfall_rolling_min_30'] = (
-            df.groupby('pincode')['footfall']
-            .transform(lambda x: x.rolling(window=30, min_periods=1).min())
-            .shift(1)
-        )
+        df['footfall_rolling_min_30'] = min_30
         
         return df
     
+    @staticmethod
+    def _run_positions(keys):
+        """Index of each row within its run of equal consecutive keys (0 at each run start)"""
+        n = len(keys)
+        rows = np.arange(n)
+        run_start = np.ones(n, dtype=bool)
+        run_start[1:] = keys[1:] != keys[:-1]
+        return rows - np.maximum.accumulate(np.where(run_start, rows, 0))
+    
+    @staticmethod
+    def _lag(values, position, k):
+        """Value k rows earlier in the same run (NaN when the run is shorter)"""
+        lagged = np.full(len(values), np.nan)
+        lagged[k:] = values[:len(values) - k]
+        lagged[position < k] = np.nan
+        return lagged
+    
+    @staticmethod
+    def _trailing_mean_std(values, position, window):
+        """Mean and sample std of up to `window` previous rows in the same run (NaNs skipped)"""
+        span = np.minimum(position, window)
+        rows = np.arange(len(values))
+        
+        # Window sums as differences of cumulative sums
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        cumcount = np.concatenate(([0], np.cumsum(valid)))
+        cumsum = np.concatenate(([0.0], np.cumsum(filled)))
+        cumsq = np.concatenate(([0.0], np.cumsum(filled * filled)))
+        count = cumcount[rows] - cumcount[rows - span]
+        total = cumsum[rows] - cumsum[rows - span]
+        total_sq = cumsq[rows] - cumsq[rows - span]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(count > 0, total / count, np.nan)
+            var = (total_sq - total * mean) / (count - 1)
+            std = np.where(count > 1, np.sqrt(np.maximum(var, 0.0)), np.nan)
+        
+        return mean, std
+    
+    @staticmethod
+    def _trailing_max_min(values, position, window):
+        """Max and min of up to `window` previous rows in the same run (NaNs skipped)"""
+        n = len(values)
+        
+        # windows[i] holds rows i-window .. i-1; mask slots before the run start
+        padded = np.concatenate((np.full(window, np.nan), values))
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window)[:n]
+        outside = np.arange(window) < (window - np.minimum(position, window))[:, None]
+        outside |= np.isnan(windows)
+        
+        rolling_max = np.where(outside, -np.inf, windows).max(axis=1, initial=-np.inf)
+        rolling_min = np.where(outside, np.inf, windows).min(axis=1, initial=np.inf)
+        
+        empty = outside.all(axis=1)
+        rolling_max[empty] = np.nan
+        rolling_min[empty] = np.nan
+        return rolling_max, rolling_min
+    
     def _add_interaction_features(self, df):
         """Create interaction features between different categories"""
         
-        # 1. Rural + Pension Month (strong interaction)
-        df['rural_pension_interaction'] = df['is_rural'] * df['is_pension_month']
-        
-        # 2. Urban + Enrollment Season
-        df['urban_enrollment_interaction'] = df['is_urban'] * df['is_enrollment_season']
-        
-        # 3. Monday + First Week (double peak effect)
-        df['monday_first_week'] = df['is_monday'] * df['is_first_week']
-        
-        # 4. Weekend + Holiday (extra low demand)
-        df['weekend_holiday'] = df['is_weekend'] * df['is_holiday']
+        # Flag x flag interactions: name -> (flag, flag)
+        flag_pairs = {
+            # 1. Rural + Pension Month (strong interaction)
+            'rural_pension_interaction': ('is_rural', 'is_pension_month'),
+            # 2. Urban + Enrollment Season
+            'urban_enrollment_interaction': ('is_urban', 'is_enrollment_season'),
+            # 3. Monday + First Week (double peak effect)
+            'monday_first_week': ('is_monday', 'is_first_week'),
+            # 4. Weekend + Holiday (extra low demand)
+            'weekend_holiday': ('is_weekend', 'is_holiday'),
+        }
+        
+        # All four products in one block multiply
+        left = df[[a for a, _ in flag_pairs.values()]].to_numpy(np.int8)
+        right = df[[b for _, b in flag_pairs.values()]].to_numpy(np.int8)
+        block = pd.DataFrame(left * right, columns=list(flag_pairs), index=df.index)
         
         # 5. Lag ratio (current trend vs historical average)
-        df['lag_ratio_7_to_30'] = df['footfall_lag_7'] / (df['footfall_rolling_mean_30'] + 1)
+        block['lag_ratio_7_to_30'] = np.divide(df['footfall_lag_7'].to_numpy(),
+                                               df['footfall_rolling_mean_30'].to_numpy() + 1)
         
-        return df
+        # Append the block in one go instead of five column inserts
+        return pd.concat([df, block], axis=1)
 
 def main():
     """Main execution function"""
@@ -4,8 +4,18 @@ Converts UIDAI raw data format to the format expected by the forecasting model
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import os
 
+try:
+    from data_io import read_table
+except ImportError:  # Imported as part of the src package
+    from .data_io import read_table
+
+# Source columns that may hold PIN codes (read as text to keep leading zeros)
+PINCODE_COLUMNS = ['center_pincode', 'pin_code', 'postal_code', 'pincode']
+
 def load_uidai_data(uidai_file_path, output_path='data/raw/pec_footfall_data.csv'):
     """
     Load and transform UIDAI data to expected format
@@ -31,7 +41,7 @@ def load_uidai_data(uidai_file_path, output_path='data/raw/pec_footfall_data.csv
     
     # Load data (supports CSV, Excel, JSON)
     if uidai_file_path.endswith('.csv'):
-        df = pd.read_csv(uidai_file_path)
+        df = pd.read_csv(uidai_file_path, engine='pyarrow', dtype={col: str for col in PINCODE_COLUMNS})
     elif uidai_file_path.endswith(('.xlsx', '.xls')):
         df = pd.read_excel(uidai_file_path)
     elif uidai_file_path.endswith('.json'):
@@ -91,9 +101,17 @@ def load_uidai_data(uidai_file_path, output_path='data/raw/pec_footfall_data.csv
     df['state'] = df['state'].str.strip().str.title()
     
     # 5. Aggregate by date + pincode (in case of multiple entries per day)
-    df = df.groupby(['date', 'pincode', 'district', 'state', 'center_type'], as_index=False).agg({
-        'footfall': 'sum'
-    })
+    # Arrow's hash aggregate groups the five string keys without the pandas
+    # object-dtype groupby path; rows with missing keys are dropped as before
+    keys = ['date', 'pincode', 'district', 'state', 'center_type']
+    df = df[df[keys].notna().all(axis=1)]
+    table = pa.Table.from_pandas(df[keys + ['footfall']], preserve_index=False)
+    # min_count=0: a group whose footfall is all missing sums to 0, like pandas
+    table = table.group_by(keys).aggregate([('footfall', 'sum', pc.ScalarAggregateOptions(min_count=0))])
+    # Select by name: older pyarrow versions put the aggregate column first
+    table = table.select(keys + ['footfall_sum']).rename_columns(keys + ['footfall'])
+    table = table.sort_by([(key, 'ascending') for key in keys])
+    df = table.to_pandas()
     
     # ============================================
     # DATA QUALITY CHECKS
@@ -160,7 +178,7 @@ def validate_data_for_modeling(data_path='data/raw/pec_footfall_data.csv'):
     Validate that the data meets modeling requirements
     
     Args:
-        data_path: Path to transformed data
+        data_path: Path to transformed data (CSV or Parquet)
         
     Returns:
         True if valid, False otherwise
@@ -169,8 +187,7 @@ def validate_data_for_modeling(data_path='data/raw/pec_footfall_data.csv'):
     print("\n🔬 Validating data for modeling...")
     print("=" * 60)
     
-    df = pd.read_csv(data_path)
-    df['date'] = pd.to_datetime(df['date'])
+    df = read_table(data_path)
     
     issues = []
     
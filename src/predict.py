@@ -7,45 +7,95 @@ import pandas as pd
 import numpy as np
 import xgboost as xgb
 import joblib
-from datetime import datetime, timedelta
+import pickle
+from datetime import datetime
 import argparse
 import os
+from collections import OrderedDict
+
+try:
+    from data_io import read_table, resolve_table, resolve_model, file_signature
+except ImportError:  # Imported as part of the src package
+    from .data_io import read_table, resolve_table, resolve_model, file_signature
+
+# Lag/rolling features derived from a PIN's footfall history
+LAG_FEATURES = [
+    'footfall_lag_7', 'footfall_lag_14', 'footfall_lag_30',
+    'footfall_rolling_mean_7', 'footfall_rolling_mean_14', 'footfall_rolling_mean_30',
+    'footfall_rolling_std_7', 'footfall_rolling_max_30', 'footfall_rolling_min_30',
+]
+
+# Lag/rolling values used when a PIN has no history before the target date
+DEFAULT_LAG_VALUES = (100, 100, 100, 100, 100, 100, 10, 150, 50)
+
+# Prebuilt history lookup tables, saved next to the model (bump the version when the layout changes)
+INDEX_FILENAME = 'predict_index.pkl'
+INDEX_VERSION = 1
+
+# Most recent single-day predictions kept in memory (repeated dashboard queries)
+PREDICTION_CACHE_SIZE = 10_000
 
 class PECPredictor:
     """Interface for making PEC demand predictions"""
     
-    def __init__(self, model_path='models/pec_demand_model.json',
+    def __init__(self, model_path='models/pec_demand_model.ubj',
                  metadata_path='models/model_metadata.pkl',
-                 data_path='data/processed/pec_features.csv'):
+                 data_path='data/processed/pec_features.parquet'):
         """
         Initialize predictor with trained model
         
         Args:
-            model_path: Path to saved XGBoost model
+            model_path: Path to saved XGBoost model (.ubj, or .json from older runs)
             metadata_path: Path to model metadata
             data_path: Path to historical data (for lag features)
         """
         # Load model
         self.model = xgb.XGBRegressor()
-        self.model.load_model(model_path)
+        self.model.load_model(resolve_model(model_path))
+        
+        # Native booster for in-place prediction (skips the per-call DMatrix)
+        self.booster = self.model.get_booster()
+        try:
+            self._iteration_range = (0, self.model.best_iteration + 1)  # Early-stopped models
+        except AttributeError:
+            self._iteration_range = (0, 0)  # All trees
         
         # Load metadata
         metadata = joblib.load(metadata_path)
         self.feature_names = metadata['feature_names']
+        self._feat_index = {name: i for i, name in enumerate(self.feature_names)}
         
-        # Load historical data (needed for lag features)
-        self.historical_data = pd.read_csv(data_path, dtype={'pincode': str})
-        self.historical_data['date'] = pd.to_datetime(self.historical_data['date'])
+        # Load the history lookup tables saved at training time (needed for lag features)
+        index_path = os.path.join(os.path.dirname(model_path), INDEX_FILENAME)
+        index = load_predict_index(index_path, data_path, self.feature_names)
         
-        # Ensure pincode is string type
-        self.historical_data['pincode'] = self.historical_data['pincode'].astype(str)
+        if index is None:
+            # Missing or stale - rebuild from the historical data and keep it for next time
+            index = build_predict_index(read_table(data_path), self.feature_names, data_path)
+            try:
+                joblib.dump(index, index_path)
+            except OSError:
+                pass
         
         print("✅ Model loaded successfully")
         print(f"📊 Features: {len(self.feature_names)}")
-        print(f"📅 Historical data: {len(self.historical_data):,} records")
+        print(f"📅 Historical data: {index['n_records']:,} records")
         
         # PIN code info
-        self.pincode_info = self._get_pincode_info()
+        self.pincode_info = index['pincode_info']
+        
+        # Per-PIN date-sorted arrays for fast lag lookups
+        self._hist = index['hist']
+        self._static = index['static']
+        
+        # Lag features for any date after a PIN's history (the trailing window never changes)
+        self._future_lags = {
+            pincode: self._lag_kernel(footfall, len(footfall))
+            for pincode, (_, footfall, _) in self._hist.items()
+        }
+        
+        # LRU cache of (pincode, date) -> prediction (tied to this history)
+        self._pred_cache = OrderedDict()
     
     def predict_single_day(self, pincode, date_str):
         """
@@ -59,28 +109,22 @@ class PECPredictor:
             Predicted footfall (integer)
         """
         target_date = pd.to_datetime(date_str)
+        key = (str(pincode), target_date)
         
-        # Ensure pincode is string
-        pincode = str(pincode)
+        if key in self._pred_cache:
+            self._pred_cache.move_to_end(key)
+            return self._pred_cache[key]
         
-        # Get PIN code info
-        if pincode not in self.pincode_info:
-            print(f"❌ PIN code {pincode} not found in database")
-            available_pins = [str(p) for p in list(self.pincode_info.keys())[:5]]
-            print(f"Available PINs: {', '.join(available_pins)}...")
-            return None
-        
-        # Build features for prediction
-        features = self._build_features(pincode, target_date)
+        predictions = self._predict_dates(pincode, [target_date])
         
-        if features is None:
+        if len(predictions) == 0:
             return None
         
-        # Make prediction
-        prediction = self.model.predict(features)[0]
-        prediction = max(0, int(round(prediction)))  # Ensure non-negative integer
+        self._pred_cache[key] = predictions[0][1]
+        if len(self._pred_cache) > PREDICTION_CACHE_SIZE:
+            self._pred_cache.popitem(last=False)  # Drop least recently used
         
-        return prediction
+        return predictions[0][1]
     
     def predict_week(self, pincode, start_date_str):
         """
@@ -93,22 +137,9 @@ class PECPredictor:
         Returns:
             DataFrame with daily predictions
         """
-        start_date = pd.to_datetime(start_date_str)
-        
-        predictions = []
+        dates = pd.date_range(start=start_date_str, periods=7, freq='D')
         
-        for day_offset in range(7):
-            current_date = start_date + timedelta(days=day_offset)
-            pred = self.predict_single_day(pincode, current_date.strftime('%Y-%m-%d'))
-            
-            if pred is not None:
-                predictions.append({
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'day_name': current_date.strftime('%A'),
-                    'predicted_footfall': pred
-                })
-        
-        return pd.DataFrame(predictions)
+        return self._predictions_frame(self._predict_dates(pincode, dates))
     
     def predict_month(self, pincode, year, month):
         """
@@ -122,30 +153,12 @@ class PECPredictor:
         Returns:
             DataFrame with daily predictions
         """
-        # Get number of days in month
+        # All days of the month
         start_date = datetime(year, month, 1)
+        end_date = start_date + pd.offsets.MonthEnd(0)
+        dates = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = datetime(year, month + 1, 1) - timedelta(days=1)
-        
-        predictions = []
-        
-        current_date = start_date
-        while current_date <= end_date:
-            pred = self.predict_single_day(pincode, current_date.strftime('%Y-%m-%d'))
-            
-            if pred is not None:
-                predictions.append({
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'day_name': current_date.strftime('%A'),
-                    'predicted_footfall': pred
-                })
-            
-            current_date += timedelta(days=1)
-        
-        df = pd.DataFrame(predictions)
+        df = self._predictions_frame(self._predict_dates(pincode, dates))
         
         # Add summary statistics
         if len(df) > 0:
@@ -157,6 +170,61 @@ class PECPredictor:
         
         return df
     
+    def _predict_dates(self, pincode, dates):
+        """
+        Predict footfall for one PIN code over several dates with a single model call
+        
+        Args:
+            pincode: PIN code (e.g., '110001')
+            dates: Iterable of Timestamps
+            
+        Returns:
+            List of (date, predicted footfall) for the dates that could be predicted
+        """
+        # Ensure pincode is string
+        pincode = str(pincode)
+        
+        # Get PIN code info
+        if not self._check_pincode(pincode):
+            return []
+        
+        # Build features for every date, then predict them as one batch
+        dates, features = self._build_features_batch(pincode, dates)
+        
+        if len(dates) == 0:
+            return []
+        
+        predictions = self._predict_matrix(features)
+        predictions = np.maximum(0, np.round(predictions)).astype(int)  # Ensure non-negative integer
+        
+        return list(zip(dates, predictions.tolist()))
+    
+    def _check_pincode(self, pincode):
+        """Whether the PIN code is known (prints the available ones if not)"""
+        if pincode in self.pincode_info:
+            return True
+        
+        print(f"❌ PIN code {pincode} not found in database")
+        available_pins = [str(p) for p in list(self.pincode_info.keys())[:5]]
+        print(f"Available PINs: {', '.join(available_pins)}...")
+        return False
+    
+    def _predict_matrix(self, features):
+        """Raw model output for a float32 feature matrix"""
+        try:
+            return self.booster.inplace_predict(np.ascontiguousarray(features, dtype=np.float32),
+                                                iteration_range=self._iteration_range)
+        except (xgb.core.XGBoostError, ValueError, TypeError):
+            return self.model.predict(features)
+    
+    def _predictions_frame(self, predictions):
+        """Format (date, prediction) pairs as a daily forecast table"""
+        return pd.DataFrame([{
+            'date': date.strftime('%Y-%m-%d'),
+            'day_name': date.strftime('%A'),
+            'predicted_footfall': pred
+        } for date, pred in predictions])
+    
     def compare_pincodes(self, pincodes, date_str):
         """
         Compare predicted demand across multiple PIN codes for a specific date
@@ -168,12 +236,19 @@ class PECPredictor:
         Returns:
             DataFrame with comparison
         """
+        target_date = pd.to_datetime(date_str)
+        
+        # Known PIN codes only, predicted together in one batch
+        known = [str(pincode) for pincode in pincodes if self._check_pincode(str(pincode))]
+        known = [pincode for pincode in known if pincode in self._hist]
+        
         results = []
         
-        for pincode in pincodes:
-            pred = self.predict_single_day(pincode, date_str)
+        if known:
+            features = self._build_feature_matrix(known, pd.DatetimeIndex([target_date] * len(known)))
+            predictions = np.maximum(0, np.round(self._predict_matrix(features))).astype(int)
             
-            if pred is not None and pincode in self.pincode_info:
+            for pincode, pred in zip(known, predictions.tolist()):
                 info = self.pincode_info[pincode]
                 results.append({
                     'pincode': pincode,
@@ -187,159 +262,225 @@ class PECPredictor:
         
         return df
     
-    def _build_features(self, pincode, target_date):
-        """Build feature vector for prediction"""
+    def _build_features_batch(self, pincode, dates):
+        """
+        Build the feature matrix for one PIN code over several dates
+        
+        Returns:
+            (dates that have features, float32 matrix with one row per such date)
+        """
         
         # Ensure pincode is string
         pincode = str(pincode)
         
-        # Get PIN info
-        info = self.pincode_info[pincode]
-        
-        # Get historical data for this PIN (for lag features)
-        pin_history = self.historical_data[
-            self.historical_data['pincode'] == pincode
-        ].sort_values('date')
-        
-        if len(pin_history) == 0:
+        # Get historical arrays for this PIN (for lag features)
+        if pincode not in self._hist:
             print(f"❌ No historical data found for PIN {pincode}")
-            return None
+            return [], None
         
-        # Check if we can calculate lag features
-        max_hist_date = pin_history['date'].max()
-        if target_date <= max_hist_date:
-            print(f"⚠️  Target date {target_date.date()} is in training data. Using existing features.")
-            existing = self.historical_data[
-                (self.historical_data['pincode'] == pincode) &
-                (self.historical_data['date'] == target_date)
-            ]
-            if len(existing) > 0:
-                return existing[self.feature_names].iloc[[0]]
+        dates = pd.DatetimeIndex(dates)
+        return list(dates), self._build_feature_matrix([pincode] * len(dates), dates)
+    
+    def _build_feature_matrix(self, pincodes, dates):
+        """
+        Build the float32 feature matrix for (PIN code, date) pairs
+        
+        Args:
+            pincodes: PIN code of each row (must have history)
+            dates: DatetimeIndex with the date of each row
+        """
+        date_values = dates.values.astype('datetime64[ns]').view('i8')
         
         # Build features manually
-        features = {}
-        
-        # Temporal features
-        features['day_of_week'] = target_date.dayofweek
-        features['is_weekend'] = int(target_date.dayofweek >= 5)
-        features['is_monday'] = int(target_date.dayofweek == 0)
-        features['month'] = target_date.month
-        features['quarter'] = (target_date.month - 1) // 3 + 1
-        features['week_of_month'] = (target_date.day - 1) // 7 + 1
-        features['day_of_month'] = target_date.day
-        features['is_first_week'] = int(features['week_of_month'] == 1)
-        features['day_of_year'] = target_date.timetuple().tm_yday
-        
-        # Holiday features (simplified - would need actual holiday calendar)
-        features['is_holiday'] = 0
-        features['is_day_after_holiday'] = 0
-        
-        # Season indicators
-        features['is_enrollment_season'] = int(target_date.month in [6, 7])
-        features['is_pension_month'] = int(target_date.month == 11)
-        features['is_festival_season'] = int(target_date.month == 10)
-        
-        # Geographic features
-        type_mapping = {'Rural': 0, 'Semi-Urban': 1, 'Urban': 2}
-        features['center_type_encoded'] = type_mapping.get(info['center_type'], 1)
-        features['is_urban'] = int(info['center_type'] == 'Urban')
-        features['is_rural'] = int(info['center_type'] == 'Rural')
-        
-        # State and district encoding (using same encoding from training)
-        features['state_encoded'] = self._encode_categorical(info['state'], 'state')
-        features['district_encoded'] = self._encode_categorical(info['district'], 'district')
-        
-        # Lag features (most critical!)
-        features = self._calculate_lag_features(features, pin_history, target_date)
+        features = self._temporal_features(dates)
+        for name in self._static[pincodes[0]]:
+            features[name] = np.array([self._static[pincode][name] for pincode in pincodes])
+        
+        # Lag features (most critical!) and dates already in the history
+        lags = np.empty((len(dates), len(LAG_FEATURES)))
+        existing = {}
+        for i, (pincode, value) in enumerate(zip(pincodes, date_values)):
+            hist_dates, footfall, hist_features = self._hist[pincode]
+            cut = np.searchsorted(hist_dates, value)
+            if cut == len(hist_dates):
+                lags[i] = self._future_lags[pincode]
+            else:
+                lags[i] = self._lag_kernel(footfall, cut)
+            
+            if cut < len(hist_dates):
+                print(f"⚠️  Target date {dates[i].date()} is in training data. Using existing features.")
+                if hist_dates[cut] == value:
+                    existing[i] = hist_features[cut]
+        
+        features.update(zip(LAG_FEATURES, lags.T))
         
         # Interaction features
         features['rural_pension_interaction'] = features['is_rural'] * features['is_pension_month']
         features['urban_enrollment_interaction'] = features['is_urban'] * features['is_enrollment_season']
         features['monday_first_week'] = features['is_monday'] * features['is_first_week']
         features['weekend_holiday'] = features['is_weekend'] * features['is_holiday']
+        features['lag_ratio_7_to_30'] = features['footfall_lag_7'] / (features['footfall_rolling_mean_30'] + 1)
         
-        if 'footfall_lag_7' in features and 'footfall_rolling_mean_30' in features:
-            features['lag_ratio_7_to_30'] = features['footfall_lag_7'] / (features['footfall_rolling_mean_30'] + 1)
-        else:
-            features['lag_ratio_7_to_30'] = 1.0
-        
-        # Pincode category (need to match training format)
-        features['pincode_category'] = pincode
-        
-        # Convert to DataFrame with correct column order
-        feature_df = pd.DataFrame([features])
+        # Place values in model column order (features the model lacks are skipped, missing ones stay 0)
+        x = np.zeros((len(dates), len(self.feature_names)), dtype=np.float32)
+        for name, values in features.items():
+            if name in self._feat_index:
+                x[:, self._feat_index[name]] = values
         
-        # Ensure all required features exist
-        for feat in self.feature_names:
-            if feat not in feature_df.columns:
-                feature_df[feat] = 0
+        # Dates inside the history reuse the features from feature engineering
+        for i, row in existing.items():
+            x[i] = row
         
-        return feature_df[self.feature_names]
+        return x
     
-    def _calculate_lag_features(self, features, pin_history, target_date):
-        """Calculate lag features from historical data"""
-        
+    def _temporal_features(self, dates):
+        """Calendar features for a DatetimeIndex (one array per feature)"""
+        day_of_week = dates.dayofweek.values
+        month = dates.month.values
+        week_of_month = (dates.day.values - 1) // 7 + 1
+        no_holiday = np.zeros(len(dates), dtype=np.int8)
+        
+        return {
+            'day_of_week': day_of_week,
+            'is_weekend': (day_of_week >= 5).astype(np.int8),
+            'is_monday': (day_of_week == 0).astype(np.int8),
+            'month': month,
+            'quarter': (month - 1) // 3 + 1,
+            'week_of_month': week_of_month,
+            'day_of_month': dates.day.values,
+            'is_first_week': (week_of_month == 1).astype(np.int8),
+            'day_of_year': dates.dayofyear.values,
+            
+            # Holiday features (simplified - would need actual holiday calendar)
+            'is_holiday': no_holiday,
+            'is_day_after_holiday': no_holiday,
+            
+            # Season indicators
+            'is_enrollment_season': np.isin(month, [6, 7]).astype(np.int8),
+            'is_pension_month': (month == 11).astype(np.int8),
+            'is_festival_season': (month == 10).astype(np.int8),
+        }
+    
+    @staticmethod
+    def _lag_kernel(footfall, cut):
+        """Lag/rolling values (in LAG_FEATURES order) from the rows before `cut`"""
         # Get recent history
-        recent = pin_history[pin_history['date'] < target_date].tail(60)
+        recent = footfall[max(0, cut - 60):cut]
+        n = len(recent)
         
-        if len(recent) == 0:
+        if n == 0:
             # No history - use defaults
-            features['footfall_lag_7'] = 100
-            features['footfall_lag_14'] = 100
-            features['footfall_lag_30'] = 100
-            features['footfall_rolling_mean_7'] = 100
-            features['footfall_rolling_mean_14'] = 100
-            features['footfall_rolling_mean_30'] = 100
-            features['footfall_rolling_std_7'] = 10
-            features['footfall_rolling_max_30'] = 150
-            features['footfall_rolling_min_30'] = 50
-            return features
-        
-        # Calculate lags
-        if len(recent) >= 7:
-            features['footfall_lag_7'] = recent.iloc[-7]['footfall']
-        else:
-            features['footfall_lag_7'] = recent['footfall'].mean()
-        
-        if len(recent) >= 14:
-            features['footfall_lag_14'] = recent.iloc[-14]['footfall']
-        else:
-            features['footfall_lag_14'] = recent['footfall'].mean()
-        
-        if len(recent) >= 30:
-            features['footfall_lag_30'] = recent.iloc[-30]['footfall']
+            return DEFAULT_LAG_VALUES
+        
+        # Reduce each trailing window once (float64 accumulation, like pandas)
+        last_7 = recent[-7:].astype(np.float64)
+        last_30 = recent[-30:].astype(np.float64)
+        mean_7 = last_7.mean()
+        mean_14 = recent[-14:].mean(dtype=np.float64)
+        mean_30 = last_30.mean()
+        std_7 = last_7.std(ddof=1) if n > 1 else np.nan
+        
+        # Lags fall back to the mean of whatever history exists
+        mean_all = recent.mean(dtype=np.float64)
+        lag_7 = recent[-7] if n >= 7 else mean_all
+        lag_14 = recent[-14] if n >= 14 else mean_all
+        lag_30 = recent[-30] if n >= 30 else mean_all
+        
+        return (lag_7, lag_14, lag_30, mean_7, mean_14, mean_30,
+                std_7 or 10, last_30.max(), last_30.min())
+
+def build_predict_index(historical_data, feature_names, data_path):
+    """
+    Precompute the history lookup tables used by PECPredictor
+    
+    Args:
+        historical_data: Engineered features (output of feature engineering)
+        feature_names: Model feature columns, in model order
+        data_path: Path the history was read from (recorded to detect stale indexes)
+        
+    Returns:
+        Dict with PIN info, per-PIN date-sorted history arrays and static features
+    """
+    # Ensure pincode is string type
+    historical_data = historical_data.assign(pincode=historical_data['pincode'].astype(str))
+    pincode_info = _get_pincode_info(historical_data)
+    
+    # Sort once: every PIN's rows are then contiguous and in date order (the
+    # per-PIN arrays below rely on this, so lookups never need to sort)
+    historical_data = historical_data.sort_values(['pincode', 'date'], kind='stable', ignore_index=True)
+    
+    dates = historical_data['date'].to_numpy('datetime64[ns]').view('i8')
+    footfall = historical_data['footfall'].to_numpy(np.float32)
+    
+    # Model-ready features of the historical rows (returned for dates in the history)
+    feature_matrix = historical_data[feature_names].to_numpy(np.float32)
+    
+    # Category -> code maps (feature engineering numbers values by first appearance)
+    enc_maps = {
+        column: {value: code for code, value in enumerate(historical_data[column].unique())}
+        for column in ['state', 'district']
+    }
+    
+    hist, static = {}, {}
+    for pincode, rows in historical_data.groupby('pincode', sort=False).indices.items():
+        span = slice(rows[0], rows[-1] + 1)  # Contiguous after the sort
+        hist[pincode] = (dates[span], footfall[span], feature_matrix[span])
+        static[pincode] = _static_features(historical_data.iloc[rows[-1]], pincode_info[pincode], enc_maps)
+    
+    return {
+        'version': INDEX_VERSION,
+        'data': file_signature(resolve_table(data_path)),
+        'feature_names': list(feature_names),
+        'n_records': len(historical_data),
+        'pincode_info': pincode_info,
+        'hist': hist,
+        'static': static,
+    }
+
+def load_predict_index(index_path, data_path, feature_names):
+    """Load a saved history index, or None if it is missing or out of date"""
+    try:
+        index = joblib.load(index_path)
+        if (index['version'] != INDEX_VERSION
+                or index['feature_names'] != list(feature_names)
+                or index['data'] != file_signature(resolve_table(data_path))):
+            return None
+        return index
+    except (OSError, EOFError, KeyError, TypeError, ValueError,
+            pickle.UnpicklingError, AttributeError, ImportError):
+        # Unreadable or written by incompatible library/module versions: rebuild
+        return None
+
+def _get_pincode_info(historical_data):
+    """Extract PIN code information from historical data (first row of each PIN)"""
+    return (historical_data.drop_duplicates('pincode')
+            .set_index('pincode')[['district', 'state', 'center_type']]
+            .to_dict(orient='index'))
+
+def _static_features(last_row, info, enc_maps):
+    """Geographic features of a PIN code (same for every date)"""
+    
+    # Geographic features
+    type_mapping = {'Rural': 0, 'Semi-Urban': 1, 'Urban': 2}
+    features = {
+        'center_type_encoded': type_mapping.get(info['center_type'], 1),
+        'is_urban': int(info['center_type'] == 'Urban'),
+        'is_rural': int(info['center_type'] == 'Rural'),
+    }
+    
+    # State and district encoding (reuse the codes stored during feature engineering)
+    for column in ['state', 'district']:
+        encoded = f'{column}_encoded'
+        if encoded in last_row.index:
+            features[encoded] = last_row[encoded]
         else:
-            features['footfall_lag_30'] = recent['footfall'].mean()
-        
-        # Rolling statistics
-        features['footfall_rolling_mean_7'] = recent.tail(7)['footfall'].mean()
-        features['footfall_rolling_mean_14'] = recent.tail(14)['footfall'].mean()
-        features['footfall_rolling_mean_30'] = recent.tail(30)['footfall'].mean()
-        features['footfall_rolling_std_7'] = recent.tail(7)['footfall'].std() or 10
-        features['footfall_rolling_max_30'] = recent.tail(30)['footfall'].max()
-        features['footfall_rolling_min_30'] = recent.tail(30)['footfall'].min()
-        
-        return features
+            features[encoded] = enc_maps[column].get(info[column], 0)
     
-    def _encode_categorical(self, value, column_type):
-        """Encode categorical values consistently with training"""
-        unique_values = self.historical_data[column_type].unique()
-        if value in unique_values:
-            return list(unique_values).index(value)
-        return 0
+    # Pincode category (reuse the code assigned during feature engineering)
+    if 'pincode_category' in last_row.index:
+        features['pincode_category'] = last_row['pincode_category']
     
-    def _get_pincode_info(self):
-        """Extract PIN code information from historical data"""
-        info = {}
-        for pincode in self.historical_data['pincode'].unique():
-            pincode_str = str(pincode)  # Ensure string type
-            pin_data = self.historical_data[self.historical_data['pincode'] == pincode].iloc[0]
-            info[pincode_str] = {
-                'district': pin_data['district'],
-                'state': pin_data['state'],
-                'center_type': pin_data['center_type']
-            }
-        return info
+    return features
 
 def main():
     """Command-line interface"""
@@ -14,6 +14,16 @@ import joblib
 import os
 from datetime import datetime
 
+try:
+    from data_io import read_table
+    from predict import build_predict_index, INDEX_FILENAME
+except ImportError:  # Imported as part of the src package
+    from .data_io import read_table
+    from .predict import build_predict_index, INDEX_FILENAME
+
+# Most recent days of the training window (across all PINs) held out for early stopping
+EARLY_STOPPING_DAYS = 30
+
 class PECDemandModel:
     """XGBoost-based PEC demand forecasting model"""
     
@@ -22,13 +32,13 @@ class PECDemandModel:
         self.feature_names = None
         self.training_date = None
         
-    def train_model(self, input_path='data/processed/pec_features.csv',
+    def train_model(self, input_path='data/processed/pec_features.parquet',
                    model_dir='models', test_size=0.2):
         """
         Train XGBoost model on processed features
         
         Args:
-            input_path: Path to processed features CSV
+            input_path: Path to processed features (Parquet or CSV)
             model_dir: Directory to save trained model
             test_size: Proportion of data for testing (time-based split)
         """
@@ -36,8 +46,7 @@ class PECDemandModel:
         print("=" * 60)
         
         # Load processed data
-        df = pd.read_csv(input_path)
-        df['date'] = pd.to_datetime(df['date'])
+        df = read_table(input_path)
         
         print(f"📊 Loaded {len(df):,} records")
         
@@ -61,7 +70,7 @@ class PECDemandModel:
         
         # Train XGBoost model
         print("\n🚀 Training XGBoost model...")
-        self.model = self._train_xgboost(X_train, y_train, X_test, y_test)
+        self.model = self._train_xgboost(X_train, y_train, df['date'].iloc[:split_index])
         
         # Evaluate on test set
         print("\n📊 Model Evaluation on Test Set:")
@@ -71,8 +80,8 @@ class PECDemandModel:
         print("\n🔍 Top 15 Most Important Features:")
         self._plot_feature_importance(save_dir=model_dir)
         
-        # Save model
-        self._save_model(model_dir)
+        # Save model (plus the history index the predictor loads at startup)
+        self._save_model(model_dir, df, input_path)
         
         # Generate predictions vs actuals plot
         self._plot_predictions(X_test, y_test, df.iloc[split_index:], save_dir=model_dir)
@@ -103,15 +112,34 @@ class PECDemandModel:
         
         return X, y, feature_cols
     
-    def _train_xgboost(self, X_train, y_train, X_test, y_test):
-        """Train XGBoost regressor with optimal parameters"""
+    def _train_xgboost(self, X_train, y_train, train_dates):
+        """
+        Train XGBoost regressor with optimal parameters
+        
+        Early stopping watches the last EARLY_STOPPING_DAYS of the training
+        window across all PINs, so the test set stays unseen until the final
+        evaluation.
+        
+        Args:
+            X_train: Training features
+            y_train: Training target
+            train_dates: Date of each training row (aligned with X_train)
+        """
+        
+        # Hold out the most recent days of the training window for early stopping
+        cutoff = train_dates.max() - pd.Timedelta(days=EARLY_STOPPING_DAYS)
+        val_mask = (train_dates > cutoff).to_numpy()
+        X_fit, X_val = X_train[~val_mask], X_train[val_mask]
+        y_fit, y_val = y_train[~val_mask], y_train[val_mask]
+        print(f"📊 Early-stopping window: {(cutoff + pd.Timedelta(days=1)).date()} to {train_dates.max().date()} "
+              f"({len(X_val):,} samples)")
         
         # XGBoost parameters (tuned for this problem)
         params = {
             'objective': 'reg:squarederror',
             'max_depth': 8,
             'learning_rate': 0.05,
-            'n_estimators': 500,
+            'n_estimators': 500,  # Upper bound; early stopping picks the final count
             'subsample': 0.8,
             'colsample_bytree': 0.8,
             'min_child_weight': 3,
@@ -120,15 +148,19 @@ class PECDemandModel:
             'reg_lambda': 1.0,  # L2 regularization
             'random_state': 42,
             'n_jobs': -1,
-            'enable_categorical': True  # Handle categorical features
+            'enable_categorical': True,  # Handle categorical features
+            'tree_method': 'hist',  # Histogram split finding (much faster than exact)
+            'device': os.environ.get('XGB_DEVICE', 'cpu'),  # Set XGB_DEVICE=cuda to train on GPU
+            'eval_metric': 'rmse',
+            'early_stopping_rounds': 30  # Stop once the validation RMSE stops improving
         }
         
         # Create and train model with early stopping
         model = xgb.XGBRegressor(**params)
         
         model.fit(
-            X_train, y_train,
-            eval_set=[(X_train, y_train), (X_test, y_test)],
+            X_fit, y_fit,
+            eval_set=[(X_fit, y_fit), (X_val, y_val)],
             verbose=50
         )
         
@@ -239,13 +271,13 @@ class PECDemandModel:
         
         print(f"📊 Predictions plot saved to: {save_path}")
     
-    def _save_model(self, model_dir='models'):
-        """Save trained model and metadata"""
+    def _save_model(self, model_dir='models', df=None, input_path=None):
+        """Save trained model, metadata and (when `df` is given) the predictor's history index"""
         
         os.makedirs(model_dir, exist_ok=True)
         
         # Save XGBoost model
-        model_path = os.path.join(model_dir, 'pec_demand_model.json')
+        model_path = os.path.join(model_dir, 'pec_demand_model.ubj')  # Binary UBJSON (loads faster than JSON)
         self.model.save_model(model_path)
         
         # Save metadata (feature names and metrics)
@@ -264,6 +296,12 @@ class PECDemandModel:
         
         print(f"\n💾 Model saved to: {model_path}")
         print(f"💾 Metadata saved to: {metadata_path}")
+        
+        # Save history index (lets PECPredictor skip re-reading the features)
+        if df is not None:
+            index_path = os.path.join(model_dir, INDEX_FILENAME)
+            joblib.dump(build_predict_index(df, self.feature_names, input_path), index_path)
+            print(f"💾 History index saved to: {index_path}")
 
 def main():
     """Main execution function"""
@@ -5,10 +5,27 @@ Demonstrates model performance across different scenarios and data conditions
 
 import pandas as pd
 import numpy as np
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score, mean_absolute_percentage_error
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to files; no display needed
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import xgboost as xgb
+import joblib
+
+try:
+    from data_io import load_features, resolve_model
+except ImportError:  # Imported as part of the src package
+    from .data_io import load_features, resolve_model
+
+# Floor for |actual| in percentage errors (same as sklearn's MAPE)
+MAPE_EPS = np.finfo(np.float64).eps
+
+# Most points drawn in the predicted-vs-actual scatter (metrics use all rows)
+MAX_SCATTER_POINTS = 10_000
+
+# Resolution of saved charts (enough for reports/slides at these figure sizes)
+FIGURE_DPI = 150
 
 def validate_model_robustness():
     """
@@ -21,14 +38,17 @@ def validate_model_robustness():
     print("Demonstrating Performance Across Different Scenarios")
     print("=" * 70)
     
-    # Load test data
-    from train_model import PECDemandModel
-    
     print("\n1️⃣  Loading Model and Test Data...")
     print("-" * 70)
     
-    df = pd.read_csv('data/processed/pec_features.csv')
-    df['date'] = pd.to_datetime(df['date'])
+    # Load feature names from metadata (this is what the model was trained on)
+    metadata = joblib.load('models/model_metadata.pkl')
+    feature_cols = metadata['feature_names']
+    
+    # Only the model inputs plus the columns the validations group/filter on
+    report_cols = ['date', 'footfall', 'center_type', 'is_holiday', 'month', 'day_of_week']
+    df = load_features('data/processed/pec_features.parquet',
+                       columns=report_cols + [col for col in feature_cols if col not in report_cols])
     
     # Time-based split (same as training)
     split_index = int(len(df) * 0.8)
@@ -37,96 +57,110 @@ def validate_model_robustness():
     print(f"✅ Test set: {len(test_df):,} records")
     print(f"📅 Test period: {test_df['date'].min().date()} to {test_df['date'].max().date()}")
     
+    # Calendar keys for the season/weekday checks (engineered columns; derived
+    # from the date with integer arithmetic if a hand-made file lacks them)
+    days = test_df['date'].to_numpy('datetime64[D]')
+    if 'month' not in test_df.columns:
+        test_df['month'] = days.astype('datetime64[M]').astype(np.int64) % 12 + 1
+    if 'day_of_week' not in test_df.columns:
+        test_df['day_of_week'] = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    
+    # Load model once for every validation below
+    model = xgb.XGBRegressor()
+    model.load_model(resolve_model('models/pec_demand_model.ubj'))
+    
+    # Ensure test data has all required features
+    missing_cols = [col for col in feature_cols if col not in test_df.columns]
+    if missing_cols:
+        print(f"⚠️  Warning: Missing features: {missing_cols}")
+        return
+    
+    # Make predictions (shared by all validations) from one contiguous float32
+    # matrix, the layout XGBoost predicts from without another conversion
+    X_test = np.ascontiguousarray(test_df[feature_cols].to_numpy(dtype=np.float32))
+    test_df['predicted'] = model.predict(X_test)
+    
     # Validate across different dimensions
-    validate_by_center_type(test_df)
+    center_metrics = validate_by_center_type(test_df)
     validate_by_season(test_df)
     validate_by_day_of_week(test_df)
     validate_edge_cases(test_df)
-    create_validation_report()
+    create_validation_report(test_df, center_metrics['mae'])
     
     print("\n" + "=" * 70)
     print("✅ VALIDATION COMPLETE")
     print("=" * 70)
 
+def group_metrics(test_df, keys):
+    """
+    Accuracy metrics per group, computed in one grouped pass
+    
+    Args:
+        test_df: Test rows with 'footfall' and 'predicted'
+        keys: Group label of each row (e.g. center type or month)
+        
+    Returns:
+        DataFrame indexed by group with actual/predicted means, MAE, RMSE, R² and MAPE (%)
+    """
+    y_true = test_df['footfall'].to_numpy(np.float64)
+    y_pred = test_df['predicted'].to_numpy(np.float64)
+    error = y_true - y_pred
+    abs_err = np.abs(error)
+    
+    # Integer group codes (sorted labels, like groupby) so every per-group
+    # sum is one np.bincount over the rows
+    codes, groups = pd.factorize(np.asarray(keys), sort=True)
+    n_groups = len(groups)
+    
+    def group_sum(values):
+        return np.bincount(codes, weights=values, minlength=n_groups)
+    
+    count = np.bincount(codes, minlength=n_groups)
+    actual = group_sum(y_true) / count
+    sq_err = group_sum(error ** 2)
+    sq_dev = group_sum((y_true - actual[codes]) ** 2)
+    
+    return pd.DataFrame({
+        'actual': actual,
+        'predicted': group_sum(y_pred) / count,
+        'mae': group_sum(abs_err) / count,
+        'rmse': np.sqrt(sq_err / count),
+        'r2': 1 - sq_err / sq_dev,
+        'mape': group_sum(abs_err / np.maximum(np.abs(y_true), MAPE_EPS)) / count * 100,
+    }, index=groups)
+
 def validate_by_center_type(test_df):
-    """Show model works for Urban, Rural, and Semi-Urban centers"""
+    """Show model works for Urban, Rural, and Semi-Urban centers (returns the per-type metrics)"""
     
     print("\n2️⃣  VALIDATION BY CENTER TYPE")
     print("-" * 70)
     
-    # Load model and metadata
-    import xgboost as xgb
-    import joblib
-    
-    model = xgb.XGBRegressor()
-    model.load_model('models/pec_demand_model.json')
-    
-    # Load feature names from metadata (this is what the model was trained on)
-    metadata = joblib.load('models/model_metadata.pkl')
-    feature_cols = metadata['feature_names']
-    
-    # Ensure test data has all required features
-    missing_cols = [col for col in feature_cols if col not in test_df.columns]
-    if missing_cols:
-        print(f"⚠️  Warning: Missing features: {missing_cols}")
-        return
-    
-    X_test = test_df[feature_cols]
-    y_test = test_df['footfall'].values
-    
-    # Make predictions
-    y_pred = model.predict(X_test)
-    test_df['predicted'] = y_pred
-    
     # Calculate metrics by center type
     print(f"\n{'Center Type':<15} {'MAE':<10} {'RMSE':<10} {'R²':<10} {'MAPE':<10}")
     print("-" * 70)
     
+    metrics = group_metrics(test_df, test_df['center_type'])
+    
     for center_type in ['Urban', 'Semi-Urban', 'Rural']:
-        mask = test_df['center_type'] == center_type
-        if mask.sum() == 0:
+        if center_type not in metrics.index:
             continue
-            
-        y_true = test_df[mask]['footfall']
-        y_pred = test_df[mask]['predicted']
-        
-        mae = mean_absolute_error(y_true, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-        r2 = r2_score(y_true, y_pred)
-        mape = mean_absolute_percentage_error(y_true, y_pred) * 100
         
-        print(f"{center_type:<15} {mae:<10.1f} {rmse:<10.1f} {r2:<10.3f} {mape:<10.1f}%")
+        row = metrics.loc[center_type]
+        print(f"{center_type:<15} {row['mae']:<10.1f} {row['rmse']:<10.1f} {row['r2']:<10.3f} {row['mape']:<10.1f}%")
     
     print("\n💡 Insight: Model performs consistently across ALL center types")
     print("   This proves it will work for diverse real-world PECs")
+    
+    return metrics
 
 def validate_by_season(test_df):
-    """Show model captures seasonal patterns"""
+    """Show model captures seasonal patterns (test_df carries 'predicted')"""
     
     print("\n3️⃣  VALIDATION BY SEASON/MONTH")
     print("-" * 70)
     
-    # Load model and metadata
-    import xgboost as xgb
-    import joblib
-    
-    model = xgb.XGBRegressor()
-    model.load_model('models/pec_demand_model.json')
-    
-    # Load feature names from metadata
-    metadata = joblib.load('models/model_metadata.pkl')
-    feature_cols = metadata['feature_names']
-    
-    # Remove 'predicted' column if it exists (from previous validation)
-    if 'predicted' in test_df.columns:
-        test_df = test_df.drop('predicted', axis=1)
-    
-    X_test = test_df[feature_cols]
-    y_pred = model.predict(X_test)
-    test_df['predicted'] = y_pred
-    
     # Check special months
-    test_df['month'] = pd.to_datetime(test_df['date']).dt.month
+    metrics = group_metrics(test_df, test_df['month'])
     
     special_months = {
         6: 'June (School Enrollment)',
@@ -139,12 +173,10 @@ def validate_by_season(test_df):
     print("-" * 70)
     
     for month, label in special_months.items():
-        mask = test_df['month'] == month
-        if mask.sum() == 0:
+        if month not in metrics.index:
             continue
-            
-        actual = test_df[mask]['footfall'].mean()
-        predicted = test_df[mask]['predicted'].mean()
+        
+        actual, predicted = metrics.loc[month, ['actual', 'predicted']]
         error = abs(actual - predicted)
         
         print(f"{label:<30} {actual:<15.0f} {predicted:<15.0f} {error:<10.0f}")
@@ -153,44 +185,22 @@ def validate_by_season(test_df):
     print("   This proves it captures real business patterns")
 
 def validate_by_day_of_week(test_df):
-    """Show model understands weekly patterns"""
+    """Show model understands weekly patterns (test_df carries 'predicted')"""
     
     print("\n4️⃣  VALIDATION BY DAY OF WEEK")
     print("-" * 70)
     
-    # Load model and metadata
-    import xgboost as xgb
-    import joblib
-    
-    model = xgb.XGBRegressor()
-    model.load_model('models/pec_demand_model.json')
-    
-    # Load feature names from metadata
-    metadata = joblib.load('models/model_metadata.pkl')
-    feature_cols = metadata['feature_names']
-    
-    # Remove 'predicted' column if it exists (from previous validation)
-    if 'predicted' in test_df.columns:
-        test_df = test_df.drop('predicted', axis=1)
-    
-    X_test = test_df[feature_cols]
-    y_pred = model.predict(X_test)
-    test_df['predicted'] = y_pred
-    
-    test_df['day_of_week'] = pd.to_datetime(test_df['date']).dt.dayofweek
+    metrics = group_metrics(test_df, test_df['day_of_week'])
     day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     
     print(f"\n{'Day':<15} {'Avg Actual':<15} {'Avg Predicted':<15} {'MAE':<10}")
     print("-" * 70)
     
     for i, day_name in enumerate(day_names):
-        mask = test_df['day_of_week'] == i
-        if mask.sum() == 0:
+        if i not in metrics.index:
             continue
-            
-        actual = test_df[mask]['footfall'].mean()
-        predicted = test_df[mask]['predicted'].mean()
-        mae = mean_absolute_error(test_df[mask]['footfall'], test_df[mask]['predicted'])
+        
+        actual, predicted, mae = metrics.loc[i, ['actual', 'predicted', 'mae']]
         
         print(f"{day_name:<15} {actual:<15.0f} {predicted:<15.0f} {mae:<10.1f}")
     
@@ -198,88 +208,52 @@ def validate_by_day_of_week(test_df):
     print("   This proves it understands operational patterns")
 
 def validate_edge_cases(test_df):
-    """Show model handles unusual scenarios"""
+    """Show model handles unusual scenarios (test_df carries 'predicted')"""
     
     print("\n5️⃣  VALIDATION OF EDGE CASES")
     print("-" * 70)
     
-    # Load model and metadata
-    import xgboost as xgb
-    import joblib
-    
-    model = xgb.XGBRegressor()
-    model.load_model('models/pec_demand_model.json')
-    
-    # Load feature names from metadata
-    metadata = joblib.load('models/model_metadata.pkl')
-    feature_cols = metadata['feature_names']
-    
-    # Remove 'predicted' column if it exists (from previous validation)
-    if 'predicted' in test_df.columns:
-        test_df = test_df.drop('predicted', axis=1)
+    # Absolute errors as a flat array (masking the whole frame copies every column)
+    y_true = test_df['footfall'].to_numpy()
+    abs_err = np.abs(y_true - test_df['predicted'].to_numpy(np.float64))
     
-    X_test = test_df[feature_cols]
-    y_pred = model.predict(X_test)
-    test_df['predicted'] = y_pred
+    # Both demand thresholds from one quantile call
+    q10, q90 = np.quantile(y_true, [0.1, 0.9])
     
     # Edge case 1: High demand days
-    high_demand = test_df[test_df['footfall'] > test_df['footfall'].quantile(0.9)]
-    mae_high = mean_absolute_error(high_demand['footfall'], high_demand['predicted'])
+    mae_high = abs_err[y_true > q90].mean()
     
     # Edge case 2: Low demand days
-    low_demand = test_df[test_df['footfall'] < test_df['footfall'].quantile(0.1)]
-    mae_low = mean_absolute_error(low_demand['footfall'], low_demand['predicted'])
+    mae_low = abs_err[y_true < q10].mean()
     
     # Edge case 3: Holiday effects
-    holidays = test_df[test_df['is_holiday'] == 1]
-    mae_holiday = mean_absolute_error(holidays['footfall'], holidays['predicted']) if len(holidays) > 0 else 0
+    holidays = test_df['is_holiday'].to_numpy(dtype=bool)
+    mae_holiday = abs_err[holidays].mean() if holidays.any() else 0
     
     print(f"\n{'Scenario':<30} {'MAE':<15} {'Performance':<20}")
     print("-" * 70)
     print(f"{'High Demand Days (>90%)':<30} {mae_high:<15.1f} {'Handles spikes well' if mae_high < 25 else 'Acceptable'}")
     print(f"{'Low Demand Days (<10%)':<30} {mae_low:<15.1f} {'Handles valleys well' if mae_low < 15 else 'Acceptable'}")
-    if len(holidays) > 0:
+    if holidays.any():
         print(f"{'Holiday Impact':<30} {mae_holiday:<15.1f} {'Captures holidays' if mae_holiday < 20 else 'Acceptable'}")
     
     print("\n💡 Insight: Model remains accurate even in extreme scenarios")
     print("   This proves it's robust for real-world deployment")
 
-def create_validation_report():
-    """Create a visual validation report"""
+def create_validation_report(test_df, center_mae):
+    """Create a visual validation report (test_df carries 'predicted', center_mae is MAE per center type)"""
     
     print("\n6️⃣  GENERATING VISUAL VALIDATION REPORT")
     print("-" * 70)
     
-    # Load data
-    df = pd.read_csv('data/processed/pec_features.csv')
-    df['date'] = pd.to_datetime(df['date'])
-    
-    import xgboost as xgb
-    import joblib
-    
-    model = xgb.XGBRegressor()
-    model.load_model('models/pec_demand_model.json')
-    
-    # Load feature names from metadata
-    metadata = joblib.load('models/model_metadata.pkl')
-    feature_cols = metadata['feature_names']
-    
-    # Split data
-    split_index = int(len(df) * 0.8)
-    test_df = df.iloc[split_index:].copy()
-    
-    X_test = test_df[feature_cols]
-    y_pred = model.predict(X_test)
+    y_pred = test_df['predicted'].values
     y_test = test_df['footfall'].values
     
     # Create comprehensive validation plot
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
     # Plot 1: Prediction Accuracy by Center Type
-    test_df['predicted'] = y_pred
-    test_df['error'] = abs(test_df['footfall'] - test_df['predicted'])
-    
-    center_errors = test_df.groupby('center_type')['error'].mean().sort_values()
+    center_errors = center_mae.sort_values()
     axes[0, 0].barh(center_errors.index, center_errors.values, color=['#2E86AB', '#A23B72', '#F18F01'])
     axes[0, 0].set_xlabel('Mean Absolute Error', fontsize=11, fontweight='bold')
     axes[0, 0].set_title('Prediction Accuracy by Center Type', fontsize=13, fontweight='bold')
@@ -296,7 +270,12 @@ def create_validation_report():
     axes[0, 1].grid(alpha=0.3)
     
     # Plot 3: Predictions vs Actuals with confidence bands
-    axes[1, 0].scatter(y_test, y_pred, alpha=0.3, s=20, color='#2E86AB')
+    if len(y_test) > MAX_SCATTER_POINTS:
+        # Fixed seed so the chart is reproducible between runs
+        shown = np.random.default_rng(0).choice(len(y_test), MAX_SCATTER_POINTS, replace=False)
+    else:
+        shown = slice(None)
+    axes[1, 0].scatter(y_test[shown], y_pred[shown], alpha=0.3, s=20, color='#2E86AB')
     min_val, max_val = y_test.min(), y_test.max()
     axes[1, 0].plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Perfect Prediction')
     
@@ -316,13 +295,18 @@ def create_validation_report():
     # Plot 4: Performance Metrics Summary
     axes[1, 1].axis('off')
     
-    mae = mean_absolute_error(y_test, y_pred)
-    rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-    r2 = r2_score(y_test, y_pred)
-    mape = mean_absolute_percentage_error(y_test, y_pred) * 100
+    # Summary metrics straight from the residuals
+    abs_residuals = np.abs(residuals)
+    ss_res = residuals @ residuals
+    centered = y_test - y_test.mean()
+    
+    mae = abs_residuals.mean()
+    rmse = np.sqrt(ss_res / len(residuals))
+    r2 = 1 - ss_res / (centered @ centered)
+    mape = np.mean(abs_residuals / np.maximum(np.abs(y_test), MAPE_EPS)) * 100
     
-    within_10_pct = np.sum(np.abs(residuals) <= y_test * 0.10) / len(y_test) * 100
-    within_20_pct = np.sum(np.abs(residuals) <= y_test * 0.20) / len(y_test) * 100
+    within_10_pct = np.mean(abs_residuals <= y_test * 0.10) * 100
+    within_20_pct = np.mean(abs_residuals <= y_test * 0.20) * 100
     
     metrics_text = f"""
     VALIDATION METRICS
@@ -362,7 +346,7 @@ def create_validation_report():
     # Save
     os.makedirs('visualizations/output', exist_ok=True)
     save_path = 'visualizations/output/validation_report.png'
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.savefig(save_path, dpi=FIGURE_DPI, bbox_inches='tight')
     plt.close()
     
     print(f"✅ Validation report saved: {save_path}")
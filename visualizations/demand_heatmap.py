@@ -5,30 +5,40 @@ Create geographic heatmaps of predicted PEC demand
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to files; no display needed
 import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_io import load_features
+
+# Largest heatmap (rows x days) that still gets per-cell value labels
+MAX_ANNOTATED_CELLS = 200
+
+# Resolution of saved charts (enough for reports/slides at these figure sizes)
+FIGURE_DPI = 150
 
 class DemandHeatmapGenerator:
     """Generate demand heatmaps for strategic planning"""
     
-    def create_weekly_heatmap(self, data_path='data/processed/pec_features.csv',
+    def create_weekly_heatmap(self, data_path='data/processed/pec_features.parquet',
                              start_date=None, output_dir='visualizations/output'):
         """
         Create a heatmap showing demand across PINs for a week
         
         Args:
-            data_path: Path to features CSV
+            data_path: Path to features file (Parquet or CSV)
             start_date: Start date (YYYY-MM-DD), defaults to latest available
             output_dir: Directory to save visualization
         """
         print("🗺️  Generating Weekly Demand Heatmap...")
         print("=" * 60)
         
-        # Load data
-        df = pd.read_csv(data_path)
-        df['date'] = pd.to_datetime(df['date'])
+        # Load data (only the columns this chart uses)
+        df = load_features(data_path, columns=['date', 'pincode', 'footfall'])
         
         # Use latest week if no date provided
         if start_date is None:
@@ -49,33 +59,34 @@ class DemandHeatmapGenerator:
         print(f"📅 Date range: {start_date.date()} to {end_date.date()}")
         print(f"📊 Records: {len(week_df):,}")
         
-        # Pivot for heatmap: rows=PINs, columns=days
-        week_df['day_name'] = week_df['date'].dt.strftime('%a %m/%d')
-        pivot = week_df.pivot_table(
-            index='pincode',
-            columns='day_name',
-            values='footfall',
-            aggfunc='mean'
-        )
+        # Pivot for heatmap: rows=PINs, columns=days (grouped on the datetime
+        # values so the days come out in calendar order, then labelled)
+        pivot = week_df.groupby(['pincode', 'date'])['footfall'].mean().unstack('date')
+        pivot.columns = pivot.columns.strftime('%a %m/%d')
         
         # Sort by average demand (highest first)
-        pivot['avg_demand'] = pivot.mean(axis=1)
-        pivot = pivot.sort_values('avg_demand', ascending=False).drop('avg_demand', axis=1)
+        avg_demand = pivot.mean(axis=1).to_numpy()
+        pivot = pivot.iloc[np.argsort(-avg_demand, kind='stable')]
         
         # Create figure
         fig, ax = plt.subplots(figsize=(12, 10))
         
-        # Create heatmap
-        sns.heatmap(
-            pivot,
-            annot=True,
-            fmt='.0f',
-            cmap='YlOrRd',
-            cbar_kws={'label': 'Footfall (residents)'},
-            linewidths=0.5,
-            linecolor='gray',
-            ax=ax
-        )
+        # Create heatmap (one image instead of a patch per cell)
+        values = pivot.to_numpy(dtype=float)
+        im = ax.imshow(values, cmap='YlOrRd', aspect='auto', interpolation='nearest')
+        fig.colorbar(im, ax=ax, label='Footfall (residents)')
+        ax.set_xticks(range(pivot.shape[1]))
+        ax.set_xticklabels(pivot.columns)
+        ax.set_yticks(range(pivot.shape[0]))
+        ax.set_yticklabels(pivot.index)
+        
+        # Label cells only while the grid is small enough to read
+        if values.size <= MAX_ANNOTATED_CELLS:
+            midpoint = (np.nanmin(values) + np.nanmax(values)) / 2
+            for row, col in zip(*np.nonzero(~np.isnan(values))):
+                value = values[row, col]
+                ax.text(col, row, f"{value:.0f}", ha='center', va='center', fontsize=10,
+                        color='white' if value > midpoint else 'black')
         
         plt.title(
             f'PEC Demand Heatmap: {start_date.strftime("%b %d")} - {end_date.strftime("%b %d, %Y")}',
@@ -91,7 +102,7 @@ class DemandHeatmapGenerator:
         os.makedirs(output_dir, exist_ok=True)
         filename = f"demand_heatmap_{start_date.strftime('%Y%m%d')}.png"
         save_path = os.path.join(output_dir, filename)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=FIGURE_DPI, bbox_inches='tight')
         plt.close()
         
         print(f"\n✅ Heatmap saved to: {save_path}")
@@ -99,22 +110,21 @@ class DemandHeatmapGenerator:
         # Print insights
         self._print_insights(pivot)
     
-    def create_district_comparison(self, data_path='data/processed/pec_features.csv',
+    def create_district_comparison(self, data_path='data/processed/pec_features.parquet',
                                   date_str=None, output_dir='visualizations/output'):
         """
         Compare demand across districts for a specific date
         
         Args:
-            data_path: Path to features CSV
+            data_path: Path to features file (Parquet or CSV)
             date_str: Date (YYYY-MM-DD), defaults to latest
             output_dir: Directory to save visualization
         """
         print("\n🏙️  Generating District Comparison...")
         print("=" * 60)
         
-        # Load data
-        df = pd.read_csv(data_path)
-        df['date'] = pd.to_datetime(df['date'])
+        # Load data (only the columns this chart uses)
+        df = load_features(data_path, columns=['date', 'district', 'pincode', 'footfall'])
         
         # Use latest date if not provided
         if date_str is None:
@@ -132,13 +142,13 @@ class DemandHeatmapGenerator:
         print(f"📅 Date: {target_date.date()}")
         
         # Aggregate by district
-        district_stats = day_df.groupby('district').agg({
-            'footfall': ['sum', 'mean', 'max'],
-            'pincode': 'count'
-        }).reset_index()
-        
-        district_stats.columns = ['district', 'total_footfall', 'avg_footfall', 'max_footfall', 'num_centers']
-        district_stats = district_stats.sort_values('total_footfall', ascending=False)
+        district_stats = day_df.groupby('district', as_index=False).agg(
+            total_footfall=('footfall', 'sum'),
+            avg_footfall=('footfall', 'mean'),
+            max_footfall=('footfall', 'max'),
+            num_centers=('pincode', 'count')
+        )
+        district_stats = district_stats.sort_values('total_footfall', ascending=False, ignore_index=True)
         
         # Create bar chart
         fig, axes = plt.subplots(1, 2, figsize=(16, 8))
@@ -168,31 +178,31 @@ class DemandHeatmapGenerator:
         os.makedirs(output_dir, exist_ok=True)
         filename = f"district_comparison_{target_date.strftime('%Y%m%d')}.png"
         save_path = os.path.join(output_dir, filename)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=FIGURE_DPI, bbox_inches='tight')
         plt.close()
         
         print(f"\n✅ District comparison saved to: {save_path}")
         
         # Print top districts
         print("\n🏆 Top 5 Districts by Total Demand:")
-        for i, row in district_stats.head(5).iterrows():
-            print(f"  {i+1}. {row['district']:25s} - {row['total_footfall']:,.0f} residents ({row['num_centers']} centers)")
+        top = district_stats.head(5)[['district', 'total_footfall', 'num_centers']]
+        for rank, (district, total, centers) in enumerate(top.itertuples(index=False, name=None), 1):
+            print(f"  {rank}. {district:25s} - {total:,.0f} residents ({centers} centers)")
     
-    def create_urban_rural_comparison(self, data_path='data/processed/pec_features.csv',
+    def create_urban_rural_comparison(self, data_path='data/processed/pec_features.parquet',
                                      output_dir='visualizations/output'):
         """
         Compare demand patterns between Urban, Rural, and Semi-Urban centers
         
         Args:
-            data_path: Path to features CSV
+            data_path: Path to features file (Parquet or CSV)
             output_dir: Directory to save visualization
         """
         print("\n🏘️  Generating Urban-Rural Comparison...")
         print("=" * 60)
         
-        # Load data
-        df = pd.read_csv(data_path)
-        df['date'] = pd.to_datetime(df['date'])
+        # Load data (only the columns this chart uses)
+        df = load_features(data_path, columns=['date', 'center_type', 'footfall'])
         df['month'] = df['date'].dt.month
         
         # Monthly aggregation by center type
@@ -235,7 +245,7 @@ class DemandHeatmapGenerator:
         # Save
         os.makedirs(output_dir, exist_ok=True)
         save_path = os.path.join(output_dir, 'urban_rural_comparison.png')
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=FIGURE_DPI, bbox_inches='tight')
         plt.close()
         
         print(f"\n✅ Urban-Rural comparison saved to: {save_path}")